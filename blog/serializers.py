@@ -70,6 +70,8 @@ class CategorySerializer(serializers.ModelSerializer):
         Returns:
             int: Count of published posts in this category
         """
+        if hasattr(obj, 'post_count'):
+            return obj.post_count
         return obj.posts.filter(status='published').count()
 
 
@@ -104,6 +106,8 @@ class TagSerializer(serializers.ModelSerializer):
         Returns:
             int: Count of published posts tagged with this tag
         """
+        if hasattr(obj, 'post_count'):
+            return obj.post_count
         return obj.posts.filter(status='published').count()
 
 
@@ -215,6 +219,8 @@ class BlogPostSerializer(ValidationMixin, serializers.ModelSerializer):
         Returns:
             int: Count of approved comments on this post
         """
+        if hasattr(obj, 'comment_count'):
+            return obj.comment_count
         return obj.comments.filter(approved=True).count()
     
     def validate_title(self, value):
@@ -275,4 +281,6 @@ class BlogPostListSerializer(serializers.ModelSerializer):
         Returns:
             int: Count of approved comments on this post
         """
+        if hasattr(obj, 'comment_count'):
+            return obj.comment_count
         return obj.comments.filter(approved=True).count()
\ No newline at end of file
@@ -8,7 +8,8 @@ from views and providing reusable methods for blog-related operations.
 import logging
 import time
 from typing import List, Optional, Dict, Any
-from django.db.models import QuerySet, F, Q, Prefetch, Count
+from django.db.models import QuerySet, F, Q, Prefetch, Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from django.core.exceptions import ValidationError
 from django.contrib.auth.models import User
@@ -40,6 +41,10 @@ class BlogPostService:
         """
         Get published blog posts with optional filtering and optimized queries.
         
+        The approved comment count of each post and the published post
+        counts of its category and tags are annotated in the main and
+        prefetch queries, so serializing a page runs no per-row queries.
+        
         Args:
             category_slug: Filter by category slug
             tag_slug: Filter by tag slug
@@ -52,10 +57,32 @@ class BlogPostService:
         logger.info(f"Fetching published posts - category: {category_slug}, tag: {tag_slug}, featured_only: {featured_only}")
         
         try:
+            # Counts are correlated subqueries rather than Count() over the
+            # relation: the tags prefetch already joins posts, and a joined
+            # Count would also force a GROUP BY into the paginator's COUNT
+            published_posts = BlogPost.objects.filter(status='published').order_by()
+            category_post_count = published_posts.filter(
+                category=OuterRef('pk')
+            ).values('category').annotate(count=Count('pk')).values('count')
+            tag_post_count = published_posts.filter(
+                tags=OuterRef('pk')
+            ).values('tags').annotate(count=Count('pk')).values('count')
+            approved_comment_count = Comment.objects.filter(
+                post=OuterRef('pk'), approved=True
+            ).order_by().values('post').annotate(count=Count('pk')).values('count')
+            
             queryset = BlogPost.objects.select_related(
-                'category', 'author'
+                'author'
             ).prefetch_related(
-                'tags', 'comments'
+                Prefetch('category', queryset=Category.objects.annotate(
+                    post_count=Coalesce(Subquery(category_post_count), 0)
+                )),
+                Prefetch('tags', queryset=Tag.objects.annotate(
+                    post_count=Coalesce(Subquery(tag_post_count), 0)
+                )),
+                'comments'
+            ).annotate(
+                comment_count=Coalesce(Subquery(approved_comment_count), 0)
             ).filter(status='published').order_by('-created_at')
             
             if category_slug:
@@ -70,11 +97,12 @@ class BlogPostService:
                 queryset = queryset.filter(featured=True)
                 logger.debug("Applied featured filter")
             
-            result_count = queryset.count()
+            # The queryset stays lazy; counting it here would repeat the
+            # paginator's COUNT query
             execution_time = time.time() - start_time
             
-            logger.info(f"Successfully fetched {result_count} published posts")
-            performance_logger.info(f"get_published_posts executed in {execution_time:.3f}s, returned {result_count} posts")
+            logger.info("Built published posts queryset")
+            performance_logger.info(f"get_published_posts executed in {execution_time:.3f}s")
             
             return queryset
             
@@ -21,7 +21,7 @@ Tests cover:
 """
 
 import pytest
-from django.urls import reverse
+from django.urls import reverse, reverse_lazy
 from django.contrib.auth.models import User
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -30,6 +30,16 @@ from datetime import datetime, timezone, timedelta
 from blog.models import BlogPost, Category, Tag, Comment
 
 
+# Named URLs without path arguments, shared by every test in this module
+POST_LIST_URL = reverse_lazy('blog:post-list')
+FEATURED_POSTS_URL = reverse_lazy('blog:featured-posts')
+CATEGORY_LIST_URL = reverse_lazy('blog:category-list')
+TAG_LIST_URL = reverse_lazy('blog:tag-list')
+RECENT_POSTS_URL = reverse_lazy('blog:recent-posts')
+POPULAR_POSTS_URL = reverse_lazy('blog:popular-posts')
+BLOG_STATS_URL = reverse_lazy('blog:blog-stats')
+
+
 @pytest.mark.django_db
 @pytest.mark.api
 class TestBlogPostListView:
@@ -37,7 +47,7 @@ class TestBlogPostListView:
     
     def test_get_blog_posts_success(self, api_client, published_blog_posts):
         """Test successful retrieval of published blog posts."""
-        url = reverse('blog:post-list')
+        url = POST_LIST_URL
         response = api_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
@@ -63,7 +73,7 @@ class TestBlogPostListView:
     
     def test_get_blog_posts_empty_list(self, api_client):
         """Test blog post list when no posts exist."""
-        url = reverse('blog:post-list')
+        url = POST_LIST_URL
         response = api_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
@@ -92,7 +102,7 @@ class TestBlogPostListView:
             status='draft'
         )
         
-        url = reverse('blog:post-list')
+        url = POST_LIST_URL
         response = api_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
@@ -102,7 +112,7 @@ class TestBlogPostListView:
     def test_blog_posts_filtering_by_category(self, api_client, published_blog_posts, blog_categories):
         """Test filtering blog posts by category slug."""
         category_slug = blog_categories[0].slug
-        url = reverse('blog:post-list')
+        url = POST_LIST_URL
         response = api_client.get(url, {'category__slug': category_slug})
         
         assert response.status_code == status.HTTP_200_OK
@@ -114,7 +124,7 @@ class TestBlogPostListView:
     def test_blog_posts_filtering_by_tag(self, api_client, published_blog_posts, blog_tags):
         """Test filtering blog posts by tag slug."""
         tag_slug = blog_tags[0].slug
-        url = reverse('blog:post-list')
+        url = POST_LIST_URL
         response = api_client.get(url, {'tags__slug': tag_slug})
         
         assert response.status_code == status.HTTP_200_OK
@@ -126,7 +136,7 @@ class TestBlogPostListView:
     
     def test_blog_posts_filtering_by_featured(self, api_client, published_blog_posts):
         """Test filtering blog posts by featured status."""
-        url = reverse('blog:post-list')
+        url = POST_LIST_URL
         response = api_client.get(url, {'featured': 'true'})
         
         assert response.status_code == status.HTTP_200_OK
@@ -137,7 +147,7 @@ class TestBlogPostListView:
     
     def test_blog_posts_filtering_by_author(self, api_client, published_blog_posts, test_user):
         """Test filtering blog posts by author."""
-        url = reverse('blog:post-list')
+        url = POST_LIST_URL
         response = api_client.get(url, {'author': test_user.id})
         
         assert response.status_code == status.HTTP_200_OK
@@ -169,7 +179,7 @@ class TestBlogPostListView:
             status='published'
         )
         
-        url = reverse('blog:post-list')
+        url = POST_LIST_URL
         
         # Search by title
         response = api_client.get(url, {'search': 'Python'})
@@ -183,9 +193,39 @@ class TestBlogPostListView:
         assert len(response.data['results']) == 1
         assert response.data['results'][0]['title'] == 'Django Web Development'
     
+    def test_blog_posts_list_query_count(self, api_client, test_user, blog_category, blog_tag,
+                                         django_assert_num_queries):
+        """Test that the post list runs a fixed number of queries with correct counts."""
+        for i in range(3):
+            post = BlogPost.objects.create(
+                title=f'Post {i+1}',
+                slug=f'post-{i+1}',
+                content=f'Content for post {i+1}',
+                author=test_user,
+                category=blog_category,
+                status='published'
+            )
+            post.tags.add(blog_tag)
+        Comment.objects.create(post=post, slug='approved-comment', name='Reader',
+                               email='reader@example.com', content='Approved', approved=True)
+        Comment.objects.create(post=post, slug='pending-comment', name='Reader',
+                               email='reader@example.com', content='Pending', approved=False)
+        
+        # COUNT, the posts with authors, then the category, tags and comments
+        # prefetches; nothing is queried per post
+        with django_assert_num_queries(5):
+            response = api_client.get(POST_LIST_URL)
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['count'] == 3
+        for result in response.data['results']:
+            assert result['category']['posts_count'] == 3
+            assert [tag['posts_count'] for tag in result['tags']] == [3]
+        assert [result['comments_count'] for result in response.data['results']] == [1, 0, 0]
+    
     def test_blog_posts_ordering(self, api_client, published_blog_posts):
         """Test ordering blog posts by different fields."""
-        url = reverse('blog:post-list')
+        url = POST_LIST_URL
         
         # Test ordering by published_at (default)
         response = api_client.get(url, {'ordering': '-published_at'})
@@ -217,7 +257,7 @@ class TestBlogPostListView:
                 status='published'
             )
         
-        url = reverse('blog:post-list')
+        url = POST_LIST_URL
         
         # Test default pagination
         response = api_client.get(url)
@@ -251,7 +291,7 @@ class TestBlogPostListView:
         )
         post.tags.add(blog_tags[0])
         
-        url = reverse('blog:post-list')
+        url = POST_LIST_URL
         response = api_client.get(url, {
             'featured': 'true',
             'category__slug': blog_categories[0].slug,
@@ -338,7 +378,7 @@ class TestFeaturedBlogPostsView:
     
     def test_get_featured_posts_success(self, api_client, published_blog_posts):
         """Test successful retrieval of featured blog posts."""
-        url = reverse('blog:featured-posts')
+        url = FEATURED_POSTS_URL
         response = api_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
@@ -361,7 +401,7 @@ class TestFeaturedBlogPostsView:
             featured=False
         )
         
-        url = reverse('blog:featured-posts')
+        url = FEATURED_POSTS_URL
         response = api_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
@@ -375,7 +415,7 @@ class TestCategoryListView:
     
     def test_get_categories_success(self, api_client, blog_categories):
         """Test successful retrieval of blog categories."""
-        url = reverse('blog:category-list')
+        url = CATEGORY_LIST_URL
         response = api_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
@@ -391,7 +431,7 @@ class TestCategoryListView:
     
     def test_get_categories_empty(self, api_client):
         """Test categories endpoint when no categories exist."""
-        url = reverse('blog:category-list')
+        url = CATEGORY_LIST_URL
         response = api_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
@@ -405,7 +445,7 @@ class TestTagListView:
     
     def test_get_tags_success(self, api_client, blog_tags):
         """Test successful retrieval of blog tags."""
-        url = reverse('blog:tag-list')
+        url = TAG_LIST_URL
         response = api_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
@@ -421,7 +461,7 @@ class TestTagListView:
     
     def test_get_tags_empty(self, api_client):
         """Test tags endpoint when no tags exist."""
-        url = reverse('blog:tag-list')
+        url = TAG_LIST_URL
         response = api_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
@@ -508,7 +548,7 @@ class TestBlogFunctionViews:
     
     def test_recent_posts_success(self, api_client, published_blog_posts):
         """Test recent posts endpoint."""
-        url = reverse('blog:recent-posts')
+        url = RECENT_POSTS_URL
         response = api_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
@@ -522,7 +562,7 @@ class TestBlogFunctionViews:
     
     def test_popular_posts_success(self, api_client, published_blog_posts):
         """Test popular posts endpoint."""
-        url = reverse('blog:popular-posts')
+        url = POPULAR_POSTS_URL
         response = api_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
@@ -536,7 +576,7 @@ class TestBlogFunctionViews:
     
     def test_blog_stats_success(self, api_client, published_blog_posts, blog_categories, blog_tags, blog_comments):
         """Test blog stats endpoint."""
-        url = reverse('blog:blog-stats')
+        url = BLOG_STATS_URL
         response = api_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
@@ -556,7 +596,7 @@ class TestBlogFunctionViews:
     
     def test_blog_stats_empty_data(self, api_client):
         """Test blog stats with no data."""
-        url = reverse('blog:blog-stats')
+        url = BLOG_STATS_URL
         response = api_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
@@ -577,7 +617,7 @@ class TestBlogAPIIntegration:
     def test_blog_api_workflow(self, api_client, test_user, blog_category, blog_tag):
         """Test complete blog API workflow."""
         # 1. Check initial empty state
-        posts_response = api_client.get(reverse('blog:post-list'))
+        posts_response = api_client.get(POST_LIST_URL)
         assert posts_response.data['count'] == 0
         
         # 2. Create blog post (simulating admin action)
@@ -594,7 +634,7 @@ class TestBlogAPIIntegration:
         blog_post.tags.add(blog_tag)
         
         # 3. Verify post appears in list
-        posts_response = api_client.get(reverse('blog:post-list'))
+        posts_response = api_client.get(POST_LIST_URL)
         assert posts_response.data['count'] == 1
         assert posts_response.data['results'][0]['title'] == 'Integration Test Post'
         
@@ -618,7 +658,7 @@ class TestBlogAPIIntegration:
         assert comment_response.status_code == status.HTTP_201_CREATED
         
         # 6. Check stats
-        stats_response = api_client.get(reverse('blog:blog-stats'))
+        stats_response = api_client.get(BLOG_STATS_URL)
         assert stats_response.data['published_posts'] == 1
         assert stats_response.data['total_comments'] == 1
     
@@ -639,7 +679,7 @@ class TestBlogAPIIntegration:
         assert response.status_code == status.HTTP_404_NOT_FOUND
         
         # Test invalid pagination
-        response = api_client.get(reverse('blog:post-list'), {'page': 999})
+        response = api_client.get(POST_LIST_URL, {'page': 999})
         assert response.status_code == status.HTTP_404_NOT_FOUND
     
     def test_blog_api_performance(self, api_client, full_test_data):
@@ -647,17 +687,17 @@ class TestBlogAPIIntegration:
         # This test ensures the API performs well with a complete dataset
         
         # Test list view with all data
-        response = api_client.get(reverse('blog:post-list'))
+        response = api_client.get(POST_LIST_URL)
         assert response.status_code == status.HTTP_200_OK
         
         # Test filtering with full dataset
-        response = api_client.get(reverse('blog:post-list'), {'featured': 'true'})
+        response = api_client.get(POST_LIST_URL, {'featured': 'true'})
         assert response.status_code == status.HTTP_200_OK
         
         # Test search with full dataset
-        response = api_client.get(reverse('blog:post-list'), {'search': 'test'})
+        response = api_client.get(POST_LIST_URL, {'search': 'test'})
         assert response.status_code == status.HTTP_200_OK
         
         # Test stats with full dataset
-        response = api_client.get(reverse('blog:blog-stats'))
+        response = api_client.get(BLOG_STATS_URL)
         assert response.status_code == status.HTTP_200_OK
\ No newline at end of file
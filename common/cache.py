@@ -140,6 +140,41 @@ class CacheManager:
             print(f"Cache delete pattern error: {e}")
             return 0
     
+    @classmethod
+    def get_version(cls, namespace: str) -> int:
+        """
+        Get the current version number of a cache namespace.
+        
+        Cache keys that embed this version become unreachable as soon as
+        the namespace is bumped, which allows invalidating whole groups of
+        keys on backends without pattern deletion.
+        
+        Args:
+            namespace: Namespace name (e.g. a model label)
+            
+        Returns:
+            Current namespace version
+        """
+        key = generate_cache_key('version', namespace)
+        cache.add(key, 1, None)
+        return cache.get(key, 1)
+    
+    @classmethod
+    def bump_version(cls, namespace: str) -> None:
+        """
+        Invalidate every key built from a namespace's current version.
+        
+        Args:
+            namespace: Namespace name to bump
+        """
+        key = generate_cache_key('version', namespace)
+        try:
+            cache.add(key, 1, None)
+            cache.incr(key)
+        except Exception as e:
+            # Log error in production
+            print(f"Cache version bump error: {e}")
+    
     @classmethod
     def clear_all(cls) -> bool:
         """
@@ -7,18 +7,63 @@ all API endpoints.
 """
 
 import logging
+from django.core.exceptions import EmptyResultSet
 from django.core.paginator import Paginator
 from django.db.models import Q
+from django.utils.functional import cached_property
 from django.utils.dateparse import parse_date
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 from rest_framework.response import Response
 from rest_framework import filters
 from django_filters.rest_framework import DjangoFilterBackend
 from collections import OrderedDict
 
+from .cache import CacheManager
+from .utils import generate_cache_key
+
 logger = logging.getLogger('api.pagination')
 
 
+class CachedCountPaginator(Paginator):
+    """
+    Django paginator that caches the total object count.
+    
+    Page number pagination runs a SELECT COUNT(*) on every request, which
+    dominates list latency on large tables. The count is cached per
+    filtered query (ordering stripped) and per model cache version, so
+    saving or deleting an instance of the model invalidates it as soon as
+    the version is bumped (see CacheManager.bump_version).
+    
+    Invalidation reaches every worker only when they share a cache (Redis
+    via REDIS_URL in settings). With the per-process local-memory fallback,
+    or after writes that skip signals such as QuerySet.update(), a count
+    can be stale for up to cache_timeout seconds.
+    """
+    cache_timeout = 300  # 5 minutes, the staleness bound without invalidation
+    
+    @cached_property
+    def count(self):
+        """Return the total number of objects, served from cache when possible."""
+        queryset = self.object_list
+        if not hasattr(queryset, 'query'):
+            return super().count
+        
+        try:
+            sql = str(queryset.order_by().query)
+        except EmptyResultSet:
+            return 0
+        
+        label = queryset.model._meta.label_lower
+        cache_key = generate_cache_key(
+            'paginator_count', label, CacheManager.get_version(label), sql
+        )
+        count = CacheManager.get(cache_key)
+        if count is None:
+            count = queryset.count()
+            CacheManager.set(cache_key, count, self.cache_timeout)
+        return count
+
+
 class StandardResultsSetPagination(PageNumberPagination):
     """
     Standard pagination class for most API endpoints.
@@ -113,12 +158,33 @@ class ProjectPagination(StandardResultsSetPagination):
     """
     Specialized pagination for portfolio projects.
     
-    Optimized for project showcase with visual layouts.
+    Optimized for project showcase with visual layouts. The total count
+    is cached since the project table changes rarely.
     """
+    django_paginator_class = CachedCountPaginator
     page_size = 9  # Good for 3x3 grid layouts
     max_page_size = 36
 
 
+class ProjectCursorPagination(CursorPagination):
+    """
+    Keyset pagination for portfolio projects.
+    
+    Avoids the COUNT(*) query and OFFSET scans of page number pagination,
+    so the cost of fetching a page does not grow with its depth. Pages
+    are always ordered newest first, which the (created_at, id) index
+    serves directly; the view's ordering parameter does not apply.
+    """
+    page_size = 9
+    page_size_query_param = 'page_size'
+    max_page_size = 36
+    ordering = ('-created_at', '-id')
+    
+    def get_ordering(self, request, queryset, view):
+        """Always paginate on the indexed keyset, ignoring view ordering."""
+        return self.ordering
+
+
 class CommentPagination(SmallResultsSetPagination):
     """
     Specialized pagination for comments.
@@ -8,6 +8,31 @@ import pytest
 # PYTEST CONFIGURATION
 # ============================================================================
 
+@pytest.fixture(scope='session')
+def django_db_setup(django_db_setup, django_db_blocker):
+    """
+    Install the PostgreSQL search objects in the test database.
+    
+    Tests run with --nomigrations, so the pg_trgm extension, the search
+    indexes and the search_vector trigger created by RunPython in the
+    portfolio migrations would otherwise be missing on PostgreSQL. The
+    migration functions are reused so the test schema cannot drift from
+    them; the trigger is dropped first so --reuse-db databases are
+    refreshed too.
+    """
+    from importlib import import_module
+    from django.db import connection
+    
+    if connection.vendor != 'postgresql':
+        return
+    trigram = import_module('portfolio.migrations.0005_project_search_trigram_indexes')
+    search_vector = import_module('portfolio.migrations.0006_project_search_vector')
+    with django_db_blocker.unblock(), connection.schema_editor() as schema_editor:
+        search_vector.drop_search_vector_trigger(None, schema_editor)
+        trigram.create_trigram_indexes(None, schema_editor)
+        search_vector.create_search_vector_trigger(None, schema_editor)
+
+
 @pytest.fixture(autouse=True)
 def enable_db_access_for_all_tests(db):
     """
@@ -19,6 +44,44 @@ def enable_db_access_for_all_tests(db):
     pass
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """
+    Clear the cache before each test.
+    
+    Rolled-back test transactions and bulk_create never fire the signals
+    that invalidate cached data, so cached responses and counts would
+    otherwise leak from one test into the next.
+    """
+    from django.core.cache import cache
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def fast_password_hasher(settings):
+    """
+    Hash test user passwords with a cheap algorithm.
+    
+    The default PBKDF2 hasher dominates the cost of creating users in
+    fixtures, and tests never rely on password hash strength.
+    """
+    settings.PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+
+@pytest.fixture(autouse=True)
+def in_memory_storage(settings):
+    """
+    Store uploaded files in memory during tests.
+    
+    Keeps image fixtures off the filesystem so tests never write to or
+    stat files under MEDIA_ROOT.
+    """
+    settings.STORAGES = {
+        **settings.STORAGES,
+        'default': {'BACKEND': 'django.core.files.storage.InMemoryStorage'},
+    }
+
+
 # ============================================================================
 # CLIENT FIXTURES
 # ============================================================================
@@ -30,11 +93,45 @@ def client():
     return Client()
 
 
-@pytest.fixture
-def api_client():
-    """Django REST Framework API client."""
+@pytest.fixture(scope='session')
+def _session_api_client():
+    """
+    Single Django REST Framework API client shared by the whole session.
+    
+    Requests ask for JSON explicitly so responses never go through the
+    BrowsableAPIRenderer and its template/form rendering.
+    """
     from rest_framework.test import APIClient
-    return APIClient()
+    client = APIClient()
+    client.defaults['HTTP_ACCEPT'] = 'application/json'
+    return client
+
+
+@pytest.fixture
+def api_client(_session_api_client):
+    """
+    Django REST Framework API client.
+    
+    Reuses the session-wide client and logs it out after each test so
+    credentials set by authenticated_api_client/admin_api_client and any
+    cookies never carry over into the next test.
+    """
+    yield _session_api_client
+    _session_api_client.logout()
+
+
+@pytest.fixture(scope='session')
+def api_request_factory():
+    """
+    Django REST Framework request factory.
+    
+    Builds requests for calling views directly, without middleware or URL
+    resolution. Use it for pure view-logic tests; keep api_client for tests
+    that depend on middleware, routing or authentication. The factory
+    holds no per-request state, so one instance serves the whole session.
+    """
+    from rest_framework.test import APIRequestFactory
+    return APIRequestFactory()
 
 
 @pytest.fixture
@@ -147,38 +244,52 @@ def blog_post(test_user, blog_category):
 # ============================================================================
 
 @pytest.fixture
-def skill():
-    """Create a test skill."""
+def skill(request):
+    """
+    Create a test skill.
+    
+    Field values can be overridden through indirect parametrization:
+    @pytest.mark.parametrize('skill', [{'name': 'React'}], indirect=True)
+    """
     from portfolio.models import Skill
-    return Skill.objects.create(
-        name='Python',
-        category='Programming Languages',
-        proficiency=90,
-        description='Advanced Python programming skills',
-        featured=True
-    )
+    return Skill.objects.create(**{
+        'name': 'Python',
+        'category': 'backend',
+        'proficiency': 4,
+        **getattr(request, 'param', {})
+    })
 
 
 @pytest.fixture
-def project():
-    """Create a test project."""
+def project(request):
+    """
+    Create a test project.
+    
+    Field values can be overridden through indirect parametrization:
+    @pytest.mark.parametrize('project', [{'title': 'Other'}], indirect=True)
+    """
     from portfolio.models import Project
-    return Project.objects.create(
-        title='Test Project',
-        description='A test project for testing purposes',
-        status='completed',
-        featured=True,
-        github_url='https://github.com/test/project',
-        live_url='https://test-project.com'
-    )
+    return Project.objects.create(**{
+        'title': 'Test Project',
+        'description': 'A test project for testing purposes',
+        'featured': True,
+        'github_url': 'https://github.com/test/project',
+        'live_url': 'https://test-project.com',
+        **getattr(request, 'param', {})
+    })
 
 
 @pytest.fixture
-def portfolio_skills(db, test_user):
-    """Create test skills for portfolio tests."""
+def portfolio_skills(db):
+    """
+    Create test skills for portfolio tests.
+    
+    The skills are rebuilt for every test rather than shared at session
+    scope, since several tests assert against an empty Skill table. A single
+    bulk INSERT keeps the per-test cost down instead.
+    """
     from portfolio.models import Skill
     
-    skills = []
     skill_data = [
         {
             'name': 'Python',
@@ -202,18 +313,15 @@ def portfolio_skills(db, test_user):
         }
     ]
     
-    for data in skill_data:
-        skills.append(Skill.objects.create(**data))
-    
-    return skills
+    return Skill.objects.bulk_create([Skill(**data) for data in skill_data])
 
 
 @pytest.fixture
-def portfolio_projects(db, test_user, portfolio_skills):
+def portfolio_projects(db, portfolio_skills):
     """Create test projects for portfolio tests."""
+    from django.utils.text import slugify
     from portfolio.models import Project
     
-    projects = []
     project_data = [
         {
             'title': 'E-commerce Platform',
@@ -233,17 +341,23 @@ def portfolio_projects(db, test_user, portfolio_skills):
         }
     ]
     
-    for data in project_data:
-        project = Project.objects.create(**data)
-        # Add some technologies to the project
-        project.technologies.add(*portfolio_skills[:2])
-        projects.append(project)
+    # bulk_create bypasses Project.save(), so slugs are set up front
+    projects = Project.objects.bulk_create([
+        Project(slug=slugify(data['title']), **data) for data in project_data
+    ])
+    # Add some technologies to every project in one INSERT
+    ProjectTechnology = Project.technologies.through
+    ProjectTechnology.objects.bulk_create([
+        ProjectTechnology(project_id=project.id, skill_id=skill.id)
+        for project in projects
+        for skill in portfolio_skills[:2]
+    ])
     
     return projects
 
 
 @pytest.fixture
-def portfolio_project(db, test_user, portfolio_skills):
+def portfolio_project(db, portfolio_skills):
     """Create a single test project for portfolio tests."""
     from portfolio.models import Project
     
@@ -261,6 +375,103 @@ def portfolio_project(db, test_user, portfolio_skills):
     return project
 
 
+@pytest.fixture
+def project_images(db, portfolio_project):
+    """Create gallery images for the test project, in display order."""
+    from django.core.files.uploadedfile import SimpleUploadedFile
+    from portfolio.models import ProjectImage
+    
+    return [
+        ProjectImage.objects.create(
+            project=portfolio_project,
+            image=SimpleUploadedFile(f'gallery{i+1}.jpg', b'image', content_type='image/jpeg'),
+            caption=f'Gallery image {i+1}',
+            order=i
+        )
+        for i in range(2)
+    ]
+
+
+@pytest.fixture
+def paginated_projects(db):
+    """
+    Create enough projects to span several pages of the project list.
+    
+    Kept function-scoped so the rows are rolled back with each test and
+    never leak into the empty-state tests of the same module.
+    """
+    from portfolio.models import Project
+    
+    # bulk_create skips Project.save(), so slugs are set explicitly
+    return Project.objects.bulk_create([
+        Project(
+            title=f'Project {i+1}',
+            slug=f'project-{i+1}',
+            description=f'Description for project {i+1}'
+        )
+        for i in range(15)
+    ])
+
+
+@pytest.fixture
+def search_projects(db):
+    """Create projects with distinct title/description content for search tests."""
+    from portfolio.models import Project
+    
+    return [
+        Project.objects.create(
+            title='E-commerce Platform',
+            slug='ecommerce-platform',
+            description='Full-stack e-commerce solution with Django and React'
+        ),
+        Project.objects.create(
+            title='Mobile App',
+            slug='mobile-app',
+            description='React Native mobile application'
+        ),
+    ]
+
+
+@pytest.fixture
+def featured_many_projects(db):
+    """Create more featured projects than the featured endpoint should return."""
+    from portfolio.models import Project
+    
+    return Project.objects.bulk_create([
+        Project(
+            title=f'Featured Project {i+1}',
+            slug=f'featured-project-{i+1}',
+            description=f'Featured description {i+1}',
+            featured=True
+        )
+        for i in range(10)
+    ])
+
+
+@pytest.fixture
+def web_and_mobile_projects(db, portfolio_skills):
+    """Create one web and one mobile project that differ in every filterable field."""
+    from portfolio.models import Project
+    
+    web_project = Project.objects.create(
+        title='Web Project',
+        slug='web-project',
+        description='Web development project',
+        featured=True
+    )
+    web_project.technologies.set([portfolio_skills[0]])
+    
+    mobile_project = Project.objects.create(
+        title='Mobile Project',
+        slug='mobile-project',
+        description='Mobile development project',
+        featured=False
+    )
+    mobile_project.technologies.set([portfolio_skills[1]])
+    
+    return [web_project, mobile_project]
+
+
 @pytest.fixture
 def full_test_data(test_user, blog_category, blog_tag, portfolio_skills, portfolio_projects, contact_message):
     """Create comprehensive test data for integration tests."""
@@ -19,7 +19,7 @@ Tests cover:
 """
 
 import pytest
-from django.urls import reverse
+from django.urls import reverse_lazy
 from django.contrib.auth.models import User
 from django.core import mail
 from rest_framework import status
@@ -29,6 +29,14 @@ from datetime import datetime, timezone, timedelta
 from contact.models import ContactMessage, Newsletter
 
 
+# Named URLs without path arguments, shared by every test in this module
+MESSAGE_CREATE_URL = reverse_lazy('contact:message-create')
+NEWSLETTER_SUBSCRIBE_URL = reverse_lazy('contact:newsletter-subscribe')
+NEWSLETTER_UNSUBSCRIBE_URL = reverse_lazy('contact:newsletter-unsubscribe')
+MESSAGE_LIST_URL = reverse_lazy('contact:message-list')
+CONTACT_STATS_URL = reverse_lazy('contact:contact-stats')
+
+
 @pytest.mark.django_db
 @pytest.mark.api
 class TestContactMessageCreateView:
@@ -36,7 +44,7 @@ class TestContactMessageCreateView:
     
     def test_create_contact_message_success(self, api_client):
         """Test successful creation of contact message."""
-        url = reverse('contact:message-create')
+        url = MESSAGE_CREATE_URL
         data = {
             'name': 'John Doe',
             'email': 'john.doe@example.com',
@@ -64,7 +72,7 @@ class TestContactMessageCreateView:
     
     def test_create_contact_message_all_subjects(self, api_client):
         """Test creating contact messages with all subject types."""
-        url = reverse('contact:message-create')
+        url = MESSAGE_CREATE_URL
         subjects = ['general', 'project', 'job', 'freelance', 'other']
         
         for subject in subjects:
@@ -88,7 +96,7 @@ class TestContactMessageCreateView:
     
     def test_create_contact_message_invalid_data(self, api_client):
         """Test contact message creation with invalid data."""
-        url = reverse('contact:message-create')
+        url = MESSAGE_CREATE_URL
         
         # Test with empty required fields
         data = {
@@ -111,7 +119,7 @@ class TestContactMessageCreateView:
     
     def test_create_contact_message_missing_fields(self, api_client):
         """Test contact message creation with missing required fields."""
-        url = reverse('contact:message-create')
+        url = MESSAGE_CREATE_URL
         data = {'name': 'John Doe'}  # Missing email, subject, message
         
         response = api_client.post(url, data, format='json')
@@ -126,7 +134,7 @@ class TestContactMessageCreateView:
     
     def test_create_contact_message_invalid_email(self, api_client):
         """Test contact message creation with invalid email formats."""
-        url = reverse('contact:message-create')
+        url = MESSAGE_CREATE_URL
         invalid_emails = [
             'invalid-email',
             'test@',
@@ -152,7 +160,7 @@ class TestContactMessageCreateView:
     
     def test_create_contact_message_invalid_subject(self, api_client):
         """Test contact message creation with invalid subject."""
-        url = reverse('contact:message-create')
+        url = MESSAGE_CREATE_URL
         data = {
             'name': 'Test User',
             'email': 'test@example.com',
@@ -168,7 +176,7 @@ class TestContactMessageCreateView:
     
     def test_create_contact_message_long_content(self, api_client):
         """Test contact message creation with very long content."""
-        url = reverse('contact:message-create')
+        url = MESSAGE_CREATE_URL
         data = {
             'name': 'A' * 100,  # Very long name
             'email': 'test@example.com',
@@ -189,7 +197,7 @@ class TestContactMessageCreateView:
     
     def test_create_contact_message_metadata_capture(self, api_client):
         """Test that contact message captures metadata correctly."""
-        url = reverse('contact:message-create')
+        url = MESSAGE_CREATE_URL
         data = {
             'name': 'Test User',
             'email': 'test@example.com',
@@ -220,7 +228,7 @@ class TestContactMessageCreateView:
         """Test that email notification is sent when contact message is created."""
         mock_send_mail.return_value = True
         
-        url = reverse('contact:message-create')
+        url = MESSAGE_CREATE_URL
         data = {
             'name': 'Test User',
             'email': 'test@example.com',
@@ -245,7 +253,7 @@ class TestNewsletterSubscribeView:
     
     def test_newsletter_subscribe_success(self, api_client):
         """Test successful newsletter subscription."""
-        url = reverse('contact:newsletter-subscribe')
+        url = NEWSLETTER_SUBSCRIBE_URL
         data = {
             'email': 'subscriber@example.com',
             'name': 'Newsletter Subscriber'
@@ -268,7 +276,7 @@ class TestNewsletterSubscribeView:
     
     def test_newsletter_subscribe_email_only(self, api_client):
         """Test newsletter subscription with email only (name optional)."""
-        url = reverse('contact:newsletter-subscribe')
+        url = NEWSLETTER_SUBSCRIBE_URL
         data = {'email': 'subscriber@example.com'}
         
         response = api_client.post(url, data, format='json')
@@ -288,7 +296,7 @@ class TestNewsletterSubscribeView:
             name='First Subscriber'
         )
         
-        url = reverse('contact:newsletter-subscribe')
+        url = NEWSLETTER_SUBSCRIBE_URL
         data = {
             'email': 'subscriber@example.com',
             'name': 'Second Subscriber'
@@ -308,7 +316,7 @@ class TestNewsletterSubscribeView:
     
     def test_newsletter_subscribe_invalid_email(self, api_client):
         """Test newsletter subscription with invalid email."""
-        url = reverse('contact:newsletter-subscribe')
+        url = NEWSLETTER_SUBSCRIBE_URL
         data = {'email': 'invalid-email'}
         
         response = api_client.post(url, data, format='json')
@@ -319,7 +327,7 @@ class TestNewsletterSubscribeView:
     
     def test_newsletter_subscribe_missing_email(self, api_client):
         """Test newsletter subscription without email."""
-        url = reverse('contact:newsletter-subscribe')
+        url = NEWSLETTER_SUBSCRIBE_URL
         data = {'name': 'Subscriber Name'}
         
         response = api_client.post(url, data, format='json')
@@ -330,7 +338,7 @@ class TestNewsletterSubscribeView:
     
     def test_newsletter_subscribe_empty_data(self, api_client):
         """Test newsletter subscription with empty data."""
-        url = reverse('contact:newsletter-subscribe')
+        url = NEWSLETTER_SUBSCRIBE_URL
         data = {}
         
         response = api_client.post(url, data, format='json')
@@ -344,7 +352,7 @@ class TestNewsletterSubscribeView:
         # This test assumes there's an unsubscribe endpoint
         # Adjust URL name based on actual implementation
         try:
-            url = reverse('contact:newsletter-unsubscribe')
+            url = NEWSLETTER_UNSUBSCRIBE_URL
             data = {'email': newsletter_subscription.email}
             
             response = api_client.post(url, data, format='json')
@@ -367,7 +375,7 @@ class TestContactMessageListView:
     def test_contact_messages_list_unauthorized(self, api_client, contact_messages):
         """Test that contact messages list requires authentication."""
         try:
-            url = reverse('contact:message-list')
+            url = MESSAGE_LIST_URL
             response = api_client.get(url)
             
             # Should require authentication
@@ -382,7 +390,7 @@ class TestContactMessageListView:
     def test_contact_messages_list_authorized(self, authenticated_api_client, contact_messages):
         """Test contact messages list with proper authentication."""
         try:
-            url = reverse('contact:message-list')
+            url = MESSAGE_LIST_URL
             response = authenticated_api_client.get(url)
             
             assert response.status_code == status.HTTP_200_OK
@@ -402,7 +410,7 @@ class TestContactMessageListView:
     def test_contact_messages_filtering_by_status(self, authenticated_api_client, contact_messages):
         """Test filtering contact messages by status."""
         try:
-            url = reverse('contact:message-list')
+            url = MESSAGE_LIST_URL
             response = authenticated_api_client.get(url, {'status': 'new'})
             
             assert response.status_code == status.HTTP_200_OK
@@ -417,7 +425,7 @@ class TestContactMessageListView:
     def test_contact_messages_filtering_by_subject(self, authenticated_api_client, contact_messages):
         """Test filtering contact messages by subject."""
         try:
-            url = reverse('contact:message-list')
+            url = MESSAGE_LIST_URL
             response = authenticated_api_client.get(url, {'subject': 'general'})
             
             assert response.status_code == status.HTTP_200_OK
@@ -438,7 +446,7 @@ class TestContactFunctionViews:
     def test_contact_stats_success(self, api_client, contact_messages, newsletter_subscriptions):
         """Test contact stats endpoint."""
         try:
-            url = reverse('contact:contact-stats')
+            url = CONTACT_STATS_URL
             response = api_client.get(url)
             
             assert response.status_code == status.HTTP_200_OK
@@ -464,7 +472,7 @@ class TestContactFunctionViews:
     def test_contact_stats_empty_data(self, api_client):
         """Test contact stats with no data."""
         try:
-            url = reverse('contact:contact-stats')
+            url = CONTACT_STATS_URL
             response = api_client.get(url)
             
             assert response.status_code == status.HTTP_200_OK
@@ -486,7 +494,7 @@ class TestContactAPIIntegration:
     def test_contact_api_workflow(self, api_client):
         """Test complete contact API workflow."""
         # 1. Submit contact message
-        contact_url = reverse('contact:message-create')
+        contact_url = MESSAGE_CREATE_URL
         contact_data = {
             'name': 'Integration Test User',
             'email': 'integration@example.com',
@@ -498,7 +506,7 @@ class TestContactAPIIntegration:
         assert contact_response.status_code == status.HTTP_201_CREATED
         
         # 2. Subscribe to newsletter
-        newsletter_url = reverse('contact:newsletter-subscribe')
+        newsletter_url = NEWSLETTER_SUBSCRIBE_URL
         newsletter_data = {
             'email': 'integration@example.com',
             'name': 'Integration Test User'
@@ -520,7 +528,7 @@ class TestContactAPIIntegration:
         
         # 4. Check stats if available
         try:
-            stats_url = reverse('contact:contact-stats')
+            stats_url = CONTACT_STATS_URL
             stats_response = api_client.get(stats_url)
             
             if stats_response.status_code == status.HTTP_200_OK:
@@ -534,7 +542,7 @@ class TestContactAPIIntegration:
     def test_contact_api_error_handling(self, api_client):
         """Test error handling across contact API endpoints."""
         # Test invalid contact message
-        contact_url = reverse('contact:message-create')
+        contact_url = MESSAGE_CREATE_URL
         invalid_data = {
             'name': '',
             'email': 'invalid-email',
@@ -546,7 +554,7 @@ class TestContactAPIIntegration:
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         
         # Test invalid newsletter subscription
-        newsletter_url = reverse('contact:newsletter-subscribe')
+        newsletter_url = NEWSLETTER_SUBSCRIBE_URL
         invalid_newsletter_data = {'email': 'invalid-email'}
         
         response = api_client.post(newsletter_url, invalid_newsletter_data, format='json')
@@ -559,7 +567,7 @@ class TestContactAPIIntegration:
     def test_contact_api_duplicate_handling(self, api_client):
         """Test handling of duplicate submissions."""
         # Submit same contact message twice
-        contact_url = reverse('contact:message-create')
+        contact_url = MESSAGE_CREATE_URL
         contact_data = {
             'name': 'Test User',
             'email': 'test@example.com',
@@ -578,7 +586,7 @@ class TestContactAPIIntegration:
         assert ContactMessage.objects.count() == 2
         
         # Subscribe to newsletter twice with same email
-        newsletter_url = reverse('contact:newsletter-subscribe')
+        newsletter_url = NEWSLETTER_SUBSCRIBE_URL
         newsletter_data = {
             'email': 'test@example.com',
             'name': 'Test User'
@@ -600,7 +608,7 @@ class TestContactAPIIntegration:
     
     def test_contact_api_rate_limiting(self, api_client):
         """Test rate limiting on contact endpoints (if implemented)."""
-        contact_url = reverse('contact:message-create')
+        contact_url = MESSAGE_CREATE_URL
         contact_data = {
             'name': 'Rate Test User',
             'email': 'ratetest@example.com',
@@ -629,7 +637,7 @@ class TestContactAPIIntegration:
     def test_contact_api_security(self, api_client):
         """Test security aspects of contact API."""
         # Test XSS prevention in contact message
-        contact_url = reverse('contact:message-create')
+        contact_url = MESSAGE_CREATE_URL
         xss_data = {
             'name': '<script>alert("xss")</script>',
             'email': 'test@example.com',
@@ -17,6 +17,7 @@ Author: Mohamed Rabiaa
 Version: 1.0.0
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -49,6 +50,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",     # Session framework
     "django.contrib.messages",     # Messaging framework
     "django.contrib.staticfiles",  # Static files management
+    "django.contrib.postgres",     # PostgreSQL search lookups
     
     # Third party apps
     "rest_framework",              # Django REST Framework for API
@@ -75,6 +77,7 @@ MIDDLEWARE = [
     "common.middleware.APIVersionMiddleware",
     "common.error_handlers.ErrorMonitoringMiddleware",
     "django.middleware.security.SecurityMiddleware",      # Security enhancements
+    "django.middleware.http.ConditionalGetMiddleware",    # ETag / 304 Not Modified handling
     "django.contrib.sessions.middleware.SessionMiddleware", # Session management
     "django.middleware.common.CommonMiddleware",          # Common functionality
     "django.middleware.csrf.CsrfViewMiddleware",          # CSRF protection
@@ -146,6 +149,34 @@ DATABASES = {
 # }
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+
+"""
+Cache configuration:
+- Cache versions, page counts and portfolio aggregates are invalidated by
+  signal handlers, so every worker should share one cache; otherwise
+  entries stay stale until their timeout
+- Production: Redis, enabled by setting REDIS_URL (e.g. redis://localhost:6379/1)
+- Development: per-process local memory, only consistent for a single
+  process such as runserver or the test suite
+"""
+REDIS_URL = os.environ.get("REDIS_URL")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -8,4 +8,5 @@ class PortfolioConfig(AppConfig):
     def ready(self):
         """Import signals and admin configurations when the app is ready."""
         import portfolio.profile  # This will register the signals
+        import portfolio.signals  # Cache invalidation for projects and skills
         import portfolio.profile_admin  # This will register the admin
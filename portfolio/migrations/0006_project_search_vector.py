@@ -0,0 +1,63 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:57
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+SEARCH_VECTOR_FUNCTION = """
+CREATE OR REPLACE FUNCTION portfolio_project_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector(coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector(coalesce(NEW.description, '')), 'B');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql
+"""
+
+SEARCH_VECTOR_TRIGGER = """
+CREATE TRIGGER portfolio_project_search_vector_trigger
+BEFORE INSERT OR UPDATE ON portfolio_project
+FOR EACH ROW EXECUTE FUNCTION portfolio_project_search_vector_update()
+"""
+
+
+def create_search_vector_trigger(apps, schema_editor):
+    """
+    Index the search vector and keep it current with a trigger on PostgreSQL.
+    
+    The trigger also covers bulk_create() and QuerySet.update(), which
+    bypass Project.save(). Existing rows are backfilled by touching them.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS portfolio_project_search_vector_gin "
+        "ON portfolio_project USING gin (search_vector)"
+    )
+    schema_editor.execute(SEARCH_VECTOR_FUNCTION)
+    schema_editor.execute(SEARCH_VECTOR_TRIGGER)
+    schema_editor.execute("UPDATE portfolio_project SET title = title")
+
+
+def drop_search_vector_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP TRIGGER IF EXISTS portfolio_project_search_vector_trigger ON portfolio_project")
+    schema_editor.execute("DROP FUNCTION IF EXISTS portfolio_project_search_vector_update()")
+    schema_editor.execute("DROP INDEX IF EXISTS portfolio_project_search_vector_gin")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("portfolio", "0005_project_search_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="project",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_vector_trigger, drop_search_vector_trigger),
+    ]
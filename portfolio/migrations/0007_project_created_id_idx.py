@@ -0,0 +1,16 @@
+# Generated by Django 4.2.7 on 2026-10-17 00:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("portfolio", "0006_project_search_vector"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(fields=["-created_at", "-id"], name="project_created_id_idx"),
+        ),
+    ]
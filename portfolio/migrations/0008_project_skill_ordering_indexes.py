@@ -0,0 +1,24 @@
+# Generated by Django 4.2.7 on 2026-10-17 00:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("portfolio", "0007_project_created_id_idx"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="project",
+            options={"ordering": ["-featured", "-created_at", "-id"]},
+        ),
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(fields=["-featured", "-created_at", "-id"], name="project_featured_keyset_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="skill",
+            index=models.Index(fields=["category", "name"], name="skill_category_name_idx"),
+        ),
+    ]
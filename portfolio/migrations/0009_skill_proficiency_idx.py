@@ -0,0 +1,16 @@
+# Generated by Django 4.2.7 on 2026-10-17 01:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("portfolio", "0008_project_skill_ordering_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="skill",
+            index=models.Index(fields=["proficiency"], name="skill_proficiency_idx"),
+        ),
+    ]
@@ -8,6 +8,7 @@ This module defines the core data models for the portfolio functionality:
 - Automatic slug generation and ordering capabilities
 """
 
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.utils.text import slugify
 
@@ -36,6 +37,8 @@ class Skill(models.Model):
     
     Meta:
         ordering: Ordered by category, then by name alphabetically
+        indexes: (category, name) for the default ordering, category
+            filtering and grouping; proficiency for proficiency filtering
     """
     name = models.CharField(max_length=100)
     category = models.CharField(max_length=50, choices=[
@@ -54,6 +57,10 @@ class Skill(models.Model):
 
     class Meta:
         ordering = ['category', 'name']
+        indexes = [
+            models.Index(fields=['category', 'name'], name='skill_category_name_idx'),
+            models.Index(fields=['proficiency'], name='skill_proficiency_idx'),
+        ]
 
     def __str__(self):
         """
@@ -85,9 +92,15 @@ class Project(models.Model):
         featured (BooleanField): Whether project should be highlighted
         created_at (DateTimeField): Project creation timestamp
         updated_at (DateTimeField): Last modification timestamp
+        search_vector (SearchVectorField): Weighted full-text search document
+            built from the title and description by a database trigger on
+            every insert and update (PostgreSQL only)
     
     Meta:
-        ordering: Featured projects first, then by creation date (newest first)
+        ordering: Featured projects first, then by creation date (newest
+            first), with the id as a tiebreaker so the order is total
+        indexes: Default (featured, created_at, id) ordering and the
+            (created_at, id) keyset for cursor pagination
     """
     title = models.CharField(max_length=200)
     slug = models.SlugField(unique=True, blank=True)
@@ -100,9 +113,14 @@ class Project(models.Model):
     featured = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    search_vector = SearchVectorField(null=True, editable=False)
 
     class Meta:
-        ordering = ['-featured', '-created_at']
+        ordering = ['-featured', '-created_at', '-id']
+        indexes = [
+            models.Index(fields=['-featured', '-created_at', '-id'], name='project_featured_keyset_idx'),
+            models.Index(fields=['-created_at', '-id'], name='project_created_id_idx'),
+        ]
 
     def save(self, *args, **kwargs):
         """
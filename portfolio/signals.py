@@ -0,0 +1,31 @@
+"""
+Signal handlers for the portfolio application.
+
+Keeps cached portfolio data consistent with the database by invalidating
+it whenever projects, skills, or project technologies change. The version
+is bumped in the configured cache, so other workers only see it when the
+cache is shared; otherwise entries expire with their own timeouts.
+"""
+
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+
+from common.cache import CacheManager
+from .models import Project, Skill
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+@receiver(post_save, sender=Skill)
+@receiver(post_delete, sender=Skill)
+@receiver(m2m_changed, sender=Project.technologies.through)
+def invalidate_project_cache(sender, **kwargs):
+    """
+    Invalidate cached project data when projects or their technologies change.
+    
+    Bumping the project cache version makes every cached paginator count
+    and the cached portfolio statistics unreachable. Skill changes are
+    included because projects are filterable by technology category and
+    skills are counted in the statistics.
+    """
+    CacheManager.bump_version(Project._meta.label_lower)
@@ -19,7 +19,7 @@ Tests cover:
 import pytest
 from django.test import TestCase
 from django.core.exceptions import ValidationError
-from django.db import IntegrityError
+from django.db import IntegrityError, connection
 from datetime import datetime
 from portfolio.models import Skill, Project, ProjectImage
 
@@ -258,6 +258,14 @@ class TestProjectModel:
         assert projects[0] == featured_project
         assert projects[1] == regular_project
     
+    @pytest.mark.skipif(connection.vendor != 'sqlite', reason="Checks SQLite's query plan")
+    def test_project_ordering_uses_index(self):
+        """Test that the default ordering is read from an index instead of sorted."""
+        plan = Project.objects.all()[:9].explain()
+        
+        assert 'project_featured_keyset_idx' in plan
+        assert 'TEMP B-TREE' not in plan
+    
     def test_project_featured_default(self):
         """Test that projects are not featured by default."""
         project = Project.objects.create(
@@ -572,13 +572,11 @@ class TestPortfolioSerializerIntegration:
         assert len(project2_data['technologies']) == 2
         
         # Verify shared skills appear in both projects
-        project1_skill_names = [tech['name'] for tech in project1_data['technologies']]
-        project2_skill_names = [tech['name'] for tech in project2_data['technologies']]
+        project1_skill_names = {tech['name'] for tech in project1_data['technologies']}
+        project2_skill_names = {tech['name'] for tech in project2_data['technologies']}
         
-        assert 'Python' in project1_skill_names
-        assert 'Django' in project1_skill_names
-        assert 'Python' in project2_skill_names
-        assert 'Django' in project2_skill_names
+        assert {'Python', 'Django'} <= project1_skill_names
+        assert {'Python', 'Django'} <= project2_skill_names
     
     def test_serializer_validation_with_relationships(self, complete_portfolio_setup):
         """Test validation across related serializers."""
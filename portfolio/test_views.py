@@ -21,23 +21,30 @@ Tests cover:
 """
 
 import pytest
-from django.urls import reverse
-from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse, reverse_lazy
 from rest_framework import status
-from rest_framework.test import APIClient
-from unittest.mock import patch, Mock
-from datetime import datetime, timezone, timedelta
 from portfolio.models import Skill, Project, ProjectImage
+from portfolio.views import ProjectListView, SkillListView, portfolio_stats, skills_by_category
 
 
-@pytest.mark.django_db
+# Named URLs without path arguments, shared by every test in this module
+SKILL_LIST_URL = reverse_lazy('portfolio:skill-list')
+PROJECT_LIST_URL = reverse_lazy('portfolio:project-list')
+FEATURED_PROJECTS_URL = reverse_lazy('portfolio:featured-projects')
+SKILLS_BY_CATEGORY_URL = reverse_lazy('portfolio:skills-by-category')
+PORTFOLIO_STATS_URL = reverse_lazy('portfolio:portfolio-stats')
+RECENT_PROJECTS_URL = reverse_lazy('portfolio:recent-projects')
+
+
+@pytest.mark.django_db(transaction=False)
 @pytest.mark.api
 class TestSkillListView:
     """Test cases for SkillListView API endpoint."""
     
     def test_get_skills_success(self, api_client, portfolio_skills):
         """Test successful retrieval of skills."""
-        url = reverse('portfolio:skill-list')
+        url = SKILL_LIST_URL
         response = api_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
@@ -54,100 +61,86 @@ class TestSkillListView:
             for field in expected_fields:
                 assert field in skill_data
     
-    def test_get_skills_empty_list(self, api_client):
-        """Test skills list when no skills exist."""
-        url = reverse('portfolio:skill-list')
-        response = api_client.get(url)
-        
+    def test_skills_list_query_count(self, api_client, portfolio_skills, django_assert_num_queries):
+        """Test that listing skills runs a fixed number of queries."""
+        # count + page, independent of the number of skills
+        with django_assert_num_queries(2):
+            response = api_client.get(SKILL_LIST_URL)
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 0
     
-    def test_skills_filtering_by_category(self, api_client, portfolio_skills):
-        """Test filtering skills by category."""
-        url = reverse('portfolio:skill-list')
-        response = api_client.get(url, {'category': 'frontend'})
-        
-        assert response.status_code == status.HTTP_200_OK
-        
-        # All returned skills should belong to frontend category
-        for skill in response.data:
-            assert skill['category'] == 'frontend'
-    
-    def test_skills_filtering_by_proficiency(self, api_client, portfolio_skills):
-        """Test filtering skills by proficiency level."""
-        url = reverse('portfolio:skill-list')
-        response = api_client.get(url, {'proficiency': 'expert'})
+    def test_get_skills_empty_list(self, api_request_factory):
+        """Test skills list when no skills exist."""
+        request = api_request_factory.get(SKILL_LIST_URL)
+        response = SkillListView.as_view()(request)
         
         assert response.status_code == status.HTTP_200_OK
-        
-        # All returned skills should have expert proficiency
-        for skill in response.data:
-            assert skill['proficiency'] == 'expert'
+        assert response.data['count'] == 0
+        assert response.data['results'] == []
     
-    def test_skills_filtering_by_featured(self, api_client, portfolio_skills):
-        """Test filtering skills by featured status."""
-        url = reverse('portfolio:skill-list')
-        response = api_client.get(url, {'featured': 'true'})
+    @pytest.mark.parametrize('field, value, expected', [
+        ('category', 'frontend', 'frontend'),
+        ('proficiency', 3, 3),
+    ])
+    def test_skills_filtering(self, api_client, portfolio_skills, field, value, expected):
+        """Test filtering skills by category and proficiency level."""
+        url = SKILL_LIST_URL
+        response = api_client.get(url, {field: value})
         
         assert response.status_code == status.HTTP_200_OK
+        assert response.data['count'] == Skill.objects.filter(**{field: expected}).count()
         
-        # All returned skills should be featured
-        for skill in response.data:
-            assert skill['featured'] is True
+        # All returned skills should match the filter
+        assert response.data['results']
+        for skill in response.data['results']:
+            assert skill[field] == expected
     
-    def test_skills_ordering(self, api_client, portfolio_skills):
+    @pytest.mark.parametrize('ordering', ['name', '-proficiency', '-created_at'])
+    def test_skills_ordering(self, api_client, portfolio_skills, ordering):
         """Test ordering skills by different fields."""
-        url = reverse('portfolio:skill-list')
-        
-        # Test ordering by name
-        response = api_client.get(url, {'ordering': 'name'})
+        response = api_client.get(SKILL_LIST_URL, {'ordering': ordering})
         assert response.status_code == status.HTTP_200_OK
         
-        if len(response.data) > 1:
-            names = [skill['name'] for skill in response.data]
-            assert names == sorted(names)
-        
-        # Test ordering by proficiency
-        response = api_client.get(url, {'ordering': '-proficiency'})
-        assert response.status_code == status.HTTP_200_OK
+        field = ordering.lstrip('-')
+        values = [skill[field] for skill in response.data['results']]
+        assert values == sorted(values, reverse=ordering.startswith('-'))
+    
+    def test_skills_ordering_by_name(self, api_client, portfolio_skills):
+        """Test that ordering by name sorts skills alphabetically."""
+        response = api_client.get(SKILL_LIST_URL, {'ordering': 'name'})
         
-        # Test ordering by years_experience
-        response = api_client.get(url, {'ordering': '-years_experience'})
-        assert response.status_code == status.HTTP_200_OK
+        names = [skill['name'] for skill in response.data['results']]
+        assert names == sorted(names)
     
-    def test_skills_combined_filters(self, api_client, test_user):
+    @pytest.mark.parametrize('skill', [{
+        'name': 'React',
+        'category': 'frontend',
+        'proficiency': 4
+    }], indirect=True)
+    def test_skills_combined_filters(self, api_client, portfolio_skills, skill):
         """Test combining multiple skill filters."""
-        # Create specific skill for testing
-        skill = Skill.objects.create(
-            name='React',
-            category='frontend',
-            proficiency='expert',
-            years_experience=5,
-            featured=True,
-            description='React framework expertise'
-        )
-        
-        url = reverse('portfolio:skill-list')
+        url = SKILL_LIST_URL
         response = api_client.get(url, {
             'category': 'frontend',
-            'proficiency': 'expert',
-            'featured': 'true'
+            'proficiency': 4
         })
         
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 1
-        assert response.data[0]['name'] == 'React'
+        # JavaScript is also a frontend skill, but not at expert level
+        assert len(response.data['results']) == 1
+        assert response.data['results'][0]['name'] == 'React'
 
 
-@pytest.mark.django_db
+@pytest.mark.django_db(transaction=False)
 @pytest.mark.api
 class TestProjectListView:
     """Test cases for ProjectListView API endpoint."""
     
-    def test_get_projects_success(self, api_client, portfolio_projects):
+    def test_get_projects_success(self, api_client, portfolio_projects, django_assert_num_queries):
         """Test successful retrieval of projects."""
-        url = reverse('portfolio:project-list')
-        response = api_client.get(url)
+        url = PROJECT_LIST_URL
+        # count + page + technologies prefetch, independent of page size
+        with django_assert_num_queries(3):
+            response = api_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
         assert 'results' in response.data
@@ -171,49 +164,35 @@ class TestProjectListView:
             for field in expected_fields:
                 assert field in project_data
     
-    def test_get_projects_empty_list(self, api_client):
+    def test_get_projects_empty_list(self, api_request_factory):
         """Test projects list when no projects exist."""
-        url = reverse('portfolio:project-list')
-        response = api_client.get(url)
+        request = api_request_factory.get(PROJECT_LIST_URL)
+        response = ProjectListView.as_view()(request)
         
         assert response.status_code == status.HTTP_200_OK
         assert response.data['count'] == 0
         assert len(response.data['results']) == 0
     
-    def test_projects_filtering_by_category(self, api_client, portfolio_projects):
-        """Test filtering projects by category."""
-        url = reverse('portfolio:project-list')
-        response = api_client.get(url, {'category': 'web'})
+    @pytest.mark.parametrize('params, lookups', [
+        ({'featured': 'true'}, {'featured': True}),
+        ({'technologies__category': 'backend'}, {'technologies__category': 'backend'}),
+    ])
+    def test_projects_filtering(self, api_client, portfolio_projects, project, params, lookups):
+        """Test filtering projects by featured status and technology category."""
+        # The fixture project is featured but has no technologies, and
+        # the task app is not featured, so each filter excludes a project
+        url = PROJECT_LIST_URL
+        response = api_client.get(url, params)
         
         assert response.status_code == status.HTTP_200_OK
         
-        # All returned projects should belong to web category
-        for project in response.data['results']:
-            assert project['category'] == 'web'
+        # Every returned project, and only those, should match the filter
+        expected = set(Project.objects.filter(**lookups).values_list('title', flat=True))
+        titles = [result['title'] for result in response.data['results']]
+        assert 0 < len(titles) < Project.objects.count()
+        assert sorted(titles) == sorted(expected)
     
-    def test_projects_filtering_by_status(self, api_client, portfolio_projects):
-        """Test filtering projects by status."""
-        url = reverse('portfolio:project-list')
-        response = api_client.get(url, {'status': 'completed'})
-        
-        assert response.status_code == status.HTTP_200_OK
-        
-        # All returned projects should have completed status
-        for project in response.data['results']:
-            assert project['status'] == 'completed'
-    
-    def test_projects_filtering_by_featured(self, api_client, portfolio_projects):
-        """Test filtering projects by featured status."""
-        url = reverse('portfolio:project-list')
-        response = api_client.get(url, {'featured': 'true'})
-        
-        assert response.status_code == status.HTTP_200_OK
-        
-        # All returned projects should be featured
-        for project in response.data['results']:
-            assert project['featured'] is True
-    
-    def test_projects_filtering_by_technology(self, api_client, test_user, portfolio_skills):
+    def test_projects_filtering_by_technology(self, api_client, portfolio_skills):
         """Test filtering projects by technology/skill."""
         # Create project with specific technology
         project = Project.objects.create(
@@ -226,35 +205,16 @@ class TestProjectListView:
         )
         project.technologies.add(portfolio_skills[0])
         
-        url = reverse('portfolio:project-list')
+        url = PROJECT_LIST_URL
         response = api_client.get(url, {'technologies': portfolio_skills[0].id})
         
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data['results']) == 1
         assert response.data['results'][0]['title'] == 'Django Project'
     
-    def test_projects_search_functionality(self, api_client, test_user):
+    def test_projects_search_functionality(self, api_client, search_projects):
         """Test search functionality across title, description, and technologies."""
-        # Create projects with specific content for searching
-        project1 = Project.objects.create(
-            title='E-commerce Platform',
-            slug='ecommerce-platform',
-            description='Full-stack e-commerce solution with Django and React',
-            short_description='E-commerce app',
-            category='web',
-            status='completed'
-        )
-        
-        project2 = Project.objects.create(
-            title='Mobile App',
-            slug='mobile-app',
-            description='React Native mobile application',
-            short_description='Mobile solution',
-            category='mobile',
-            status='completed'
-        )
-        
-        url = reverse('portfolio:project-list')
+        url = PROJECT_LIST_URL
         
         # Search by title
         response = api_client.get(url, {'search': 'E-commerce'})
@@ -267,41 +227,54 @@ class TestProjectListView:
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data['results']) == 2  # Both projects mention React
     
-    def test_projects_ordering(self, api_client, portfolio_projects):
-        """Test ordering projects by different fields."""
-        url = reverse('portfolio:project-list')
+    def test_projects_search_by_technology_not_duplicated(self, api_client):
+        """Test that a project matching several technologies is returned once."""
+        project = Project.objects.create(title='Stack Project', description='Full stack work')
+        project.technologies.add(
+            Skill.objects.create(name='React', category='frontend', proficiency=3),
+            Skill.objects.create(name='React Native', category='frontend', proficiency=2),
+        )
         
-        # Test ordering by created_at (default)
-        response = api_client.get(url, {'ordering': '-created_at'})
-        assert response.status_code == status.HTTP_200_OK
+        response = api_client.get(PROJECT_LIST_URL, {'search': 'React'})
+        assert response.data['count'] == 1
+        assert response.data['results'][0]['title'] == 'Stack Project'
+    
+    def test_projects_filtering_by_technology_category_not_duplicated(self, api_client):
+        """Test that a project with several matching technologies is returned once."""
+        project = Project.objects.create(title='Frontend Project', description='UI work')
+        project.technologies.add(
+            Skill.objects.create(name='React', category='frontend', proficiency=3),
+            Skill.objects.create(name='Vue.js', category='frontend', proficiency=2),
+        )
         
-        # Test ordering by title
-        response = api_client.get(url, {'ordering': 'title'})
+        response = api_client.get(PROJECT_LIST_URL, {'technologies__category': 'frontend'})
+        assert response.data['count'] == 1
+    
+    def test_projects_filtering_by_invalid_technology_category(self, api_client):
+        """Test that an unknown technology category is rejected."""
+        response = api_client.get(PROJECT_LIST_URL, {'technologies__category': 'bogus'})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+    
+    @pytest.mark.parametrize('ordering', ['-created_at', 'created_at', '-title'])
+    def test_projects_ordering(self, api_client, portfolio_projects, ordering):
+        """Test ordering projects by different fields."""
+        response = api_client.get(PROJECT_LIST_URL, {'ordering': ordering})
         assert response.status_code == status.HTTP_200_OK
         
-        # Verify ordering is applied
-        if len(response.data['results']) > 1:
-            titles = [project['title'] for project in response.data['results']]
-            assert titles == sorted(titles)
+        field = ordering.lstrip('-')
+        values = [project[field] for project in response.data['results']]
+        assert values == sorted(values, reverse=ordering.startswith('-'))
+    
+    def test_projects_ordering_by_title(self, api_client, portfolio_projects):
+        """Test that ordering by title sorts projects alphabetically."""
+        response = api_client.get(PROJECT_LIST_URL, {'ordering': 'title'})
         
-        # Test ordering by start_date
-        response = api_client.get(url, {'ordering': '-start_date'})
-        assert response.status_code == status.HTTP_200_OK
+        titles = [project['title'] for project in response.data['results']]
+        assert titles == sorted(titles)
     
-    def test_projects_pagination(self, api_client, test_user):
+    def test_projects_pagination(self, api_client, paginated_projects):
         """Test pagination functionality."""
-        # Create multiple projects for pagination testing
-        for i in range(15):
-            Project.objects.create(
-                title=f'Project {i+1}',
-                slug=f'project-{i+1}',
-                description=f'Description for project {i+1}',
-                short_description=f'Short desc {i+1}',
-                category='web',
-                status='completed'
-            )
-        
-        url = reverse('portfolio:project-list')
+        url = PROJECT_LIST_URL
         
         # Test default pagination
         response = api_client.get(url)
@@ -309,7 +282,7 @@ class TestProjectListView:
         assert 'next' in response.data
         assert 'previous' in response.data
         assert 'count' in response.data
-        assert response.data['count'] == 15
+        assert response.data['count'] == len(paginated_projects)
         
         # Test custom page size
         response = api_client.get(url, {'page_size': 5})
@@ -321,34 +294,77 @@ class TestProjectListView:
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data['results']) == 5
     
-    def test_projects_combined_filters(self, api_client, test_user, portfolio_skills):
+    def test_projects_list_defers_unused_columns(self, api_client, portfolio_projects,
+                                                 django_assert_num_queries):
+        """Test that list queries skip columns the list serializer never renders."""
+        with django_assert_num_queries(3) as captured:
+            api_client.get(PROJECT_LIST_URL)
+        
+        for query in captured.captured_queries:
+            assert 'detailed_description' not in query['sql']
+            assert 'search_vector' not in query['sql']
+            assert 'proficiency' not in query['sql']
+    
+    def test_projects_cursor_pagination(self, api_client, portfolio_projects, django_assert_num_queries):
+        """Test keyset pagination when a cursor is requested."""
+        # page + technologies prefetch, no COUNT(*)
+        with django_assert_num_queries(2):
+            response = api_client.get(PROJECT_LIST_URL, {'cursor': '', 'page_size': 1})
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert 'count' not in response.data
+        assert response.data['results'][0]['title'] == portfolio_projects[-1].title
+        
+        response = api_client.get(response.data['next'])
+        assert response.data['results'][0]['title'] == portfolio_projects[0].title
+        assert response.data['next'] is None
+    
+    def test_paginator_count_cached(self, api_client, portfolio_projects, django_assert_num_queries):
+        """Test that repeated list requests reuse the cached COUNT(*)."""
+        # count + page + technologies prefetch
+        with django_assert_num_queries(3):
+            api_client.get(PROJECT_LIST_URL)
+        
+        # Same filtered query again: the COUNT(*) is served from cache
+        with django_assert_num_queries(2):
+            response = api_client.get(PROJECT_LIST_URL)
+        assert response.data['count'] == len(portfolio_projects)
+    
+    def test_paginator_count_invalidated_on_save(self, api_client, portfolio_projects):
+        """Test that creating a project invalidates the cached count."""
+        response = api_client.get(PROJECT_LIST_URL)
+        assert response.data['count'] == len(portfolio_projects)
+        
+        Project.objects.create(title='Another Project', description='Yet another project')
+        
+        response = api_client.get(PROJECT_LIST_URL)
+        assert response.data['count'] == len(portfolio_projects) + 1
+    
+    @pytest.mark.parametrize('project', [{
+        'title': 'Featured Web App',
+        'slug': 'featured-web-app',
+        'description': 'Advanced web application with Django',
+        'featured': True
+    }], indirect=True)
+    def test_projects_combined_filters(self, api_client, project, portfolio_projects, portfolio_skills):
         """Test combining multiple project filters."""
-        # Create specific project for testing
-        project = Project.objects.create(
-            title='Featured Web App',
-            slug='featured-web-app',
-            description='Advanced web application with Django',
-            short_description='Web app',
-            category='web',
-            status='completed',
-            featured=True
-        )
         project.technologies.add(portfolio_skills[0])
         
-        url = reverse('portfolio:project-list')
+        url = PROJECT_LIST_URL
         response = api_client.get(url, {
             'featured': 'true',
-            'category': 'web',
-            'status': 'completed',
+            'technologies__category': 'backend',
             'search': 'Django'
         })
         
         assert response.status_code == status.HTTP_200_OK
+        # The featured E-commerce Platform also uses a backend skill,
+        # but does not mention Django
         assert len(response.data['results']) == 1
         assert response.data['results'][0]['title'] == 'Featured Web App'
 
 
-@pytest.mark.django_db
+@pytest.mark.django_db(transaction=False)
 @pytest.mark.api
 class TestProjectDetailView:
     """Test cases for ProjectDetailView API endpoint."""
@@ -382,25 +398,30 @@ class TestProjectDetailView:
         
         assert response.status_code == status.HTTP_404_NOT_FOUND
     
-    def test_project_detail_with_images(self, api_client, portfolio_project, project_images):
+    def test_project_detail_with_images(self, api_client, portfolio_project, project_images,
+                                        django_assert_num_queries):
         """Test project detail includes related images."""
         url = reverse('portfolio:project-detail', kwargs={'slug': portfolio_project.slug})
-        response = api_client.get(url)
+        # project + technologies + additional images
+        with django_assert_num_queries(3):
+            response = api_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
         
-        # Check if images are included
-        if 'images' in response.data:
-            assert isinstance(response.data['images'], list)
-            assert len(response.data['images']) == len(project_images)
+        # Check images are included
+        assert isinstance(response.data['additional_images'], list)
+        assert len(response.data['additional_images']) == len(project_images)
     
-    def test_project_detail_with_technologies(self, api_client, portfolio_project, portfolio_skills):
+    def test_project_detail_with_technologies(self, api_client, portfolio_project, portfolio_skills,
+                                              django_assert_num_queries):
         """Test project detail includes related technologies."""
         # Add technologies to project
         portfolio_project.technologies.add(*portfolio_skills[:2])
         
         url = reverse('portfolio:project-detail', kwargs={'slug': portfolio_project.slug})
-        response = api_client.get(url)
+        # project + technologies + additional images
+        with django_assert_num_queries(3):
+            response = api_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
         
@@ -410,14 +431,14 @@ class TestProjectDetailView:
         assert len(response.data['technologies']) == 2
 
 
-@pytest.mark.django_db
+@pytest.mark.django_db(transaction=False)
 @pytest.mark.api
 class TestFeaturedProjectsView:
     """Test cases for FeaturedProjectsView API endpoint."""
     
     def test_get_featured_projects_success(self, api_client, portfolio_projects):
         """Test successful retrieval of featured projects."""
-        url = reverse('portfolio:featured-projects')
+        url = FEATURED_PROJECTS_URL
         response = api_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
@@ -427,7 +448,7 @@ class TestFeaturedProjectsView:
         for project in response.data:
             assert project['featured'] is True
     
-    def test_get_featured_projects_empty(self, api_client, test_user):
+    def test_get_featured_projects_empty(self, api_client):
         """Test featured projects endpoint when no featured projects exist."""
         # Create non-featured project
         Project.objects.create(
@@ -440,27 +461,36 @@ class TestFeaturedProjectsView:
             featured=False
         )
         
-        url = reverse('portfolio:featured-projects')
+        url = FEATURED_PROJECTS_URL
         response = api_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data) == 0
     
-    def test_featured_projects_limit(self, api_client, test_user):
+    def test_featured_projects_cached(self, api_client, portfolio_projects, django_assert_num_queries):
+        """Test that repeated requests are served from the cache until projects change."""
+        response = api_client.get(FEATURED_PROJECTS_URL)
+        with django_assert_num_queries(0):
+            cached = api_client.get(FEATURED_PROJECTS_URL)
+        assert cached.data == response.data
+        
+        Project.objects.filter(featured=True).first().delete()
+        response = api_client.get(FEATURED_PROJECTS_URL)
+        assert response.data['count'] == cached.data['count'] - 1
+    
+    def test_featured_projects_ignores_unrelated_params(self, api_client, portfolio_projects,
+                                                       django_assert_num_queries):
+        """Test that non-pagination query parameters share the cached page."""
+        response = api_client.get(FEATURED_PROJECTS_URL)
+        
+        with django_assert_num_queries(0):
+            response_with_params = api_client.get(FEATURED_PROJECTS_URL, {'name': 'x', 'params': 'y'})
+        assert response_with_params.status_code == status.HTTP_200_OK
+        assert response_with_params.data == response.data
+    
+    def test_featured_projects_limit(self, api_client, featured_many_projects):
         """Test that featured projects endpoint respects limit."""
-        # Create multiple featured projects
-        for i in range(10):
-            Project.objects.create(
-                title=f'Featured Project {i+1}',
-                slug=f'featured-project-{i+1}',
-                description=f'Featured description {i+1}',
-                short_description=f'Featured {i+1}',
-                category='web',
-                status='completed',
-                featured=True
-            )
-        
-        url = reverse('portfolio:featured-projects')
+        url = FEATURED_PROJECTS_URL
         response = api_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
@@ -468,7 +498,7 @@ class TestFeaturedProjectsView:
         assert len(response.data) <= 6
 
 
-@pytest.mark.django_db
+@pytest.mark.django_db(transaction=False)
 @pytest.mark.api
 class TestProjectImageListView:
     """Test cases for ProjectImageListView API endpoint."""
@@ -504,18 +534,18 @@ class TestProjectImageListView:
         
         assert response.status_code == status.HTTP_404_NOT_FOUND
     
-    def test_project_images_ordering(self, api_client, portfolio_project, test_user):
+    def test_project_images_ordering(self, api_client, portfolio_project):
         """Test that project images are ordered correctly."""
         # Create images with specific order
         image1 = ProjectImage.objects.create(
             project=portfolio_project,
-            image='test1.jpg',
+            image=SimpleUploadedFile('test1.jpg', b'image', content_type='image/jpeg'),
             caption='First image',
             order=1
         )
         image2 = ProjectImage.objects.create(
             project=portfolio_project,
-            image='test2.jpg',
+            image=SimpleUploadedFile('test2.jpg', b'image', content_type='image/jpeg'),
             caption='Second image',
             order=2
         )
@@ -531,21 +561,24 @@ class TestProjectImageListView:
         assert response.data[1]['order'] == 2
 
 
-@pytest.mark.django_db
+@pytest.mark.django_db(transaction=False)
 @pytest.mark.api
 class TestPortfolioFunctionViews:
     """Test cases for portfolio function-based API views."""
     
-    def test_portfolio_stats_success(self, api_client, portfolio_projects, portfolio_skills):
+    def test_portfolio_stats_success(self, api_client, portfolio_projects, portfolio_skills,
+                                     django_assert_num_queries):
         """Test portfolio stats endpoint."""
-        url = reverse('portfolio:portfolio-stats')
-        response = api_client.get(url)
+        url = PORTFOLIO_STATS_URL
+        # One aggregate over projects, one over skills
+        with django_assert_num_queries(2):
+            response = api_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
         
         # Check response structure
         expected_fields = [
-            'total_projects', 'completed_projects', 'featured_projects',
+            'total_projects', 'featured_projects',
             'total_skills', 'skill_categories', 'years_experience'
         ]
         for field in expected_fields:
@@ -554,24 +587,43 @@ class TestPortfolioFunctionViews:
         # Check data accuracy
         assert response.data['total_projects'] == len(portfolio_projects)
         assert response.data['total_skills'] == len(portfolio_skills)
+        
+        # Repeated requests are answered from the cache
+        with django_assert_num_queries(0):
+            cached_response = api_client.get(url)
+        assert cached_response.data == response.data
     
-    def test_portfolio_stats_empty_data(self, api_client):
+    def test_portfolio_stats_counts(self, api_client, portfolio_projects, portfolio_skills):
+        """Test that the aggregated counters match the stored projects and skills."""
+        Skill.objects.create(name='Django', category='backend', proficiency=4)
+        
+        response = api_client.get(PORTFOLIO_STATS_URL)
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['total_projects'] == 2
+        assert response.data['featured_projects'] == 1
+        assert response.data['total_skills'] == len(portfolio_skills) + 1
+        # The extra backend skill does not add a category
+        assert response.data['skill_categories'] == 4
+    
+    def test_portfolio_stats_empty_data(self, api_request_factory):
         """Test portfolio stats with no data."""
-        url = reverse('portfolio:portfolio-stats')
-        response = api_client.get(url)
+        request = api_request_factory.get(PORTFOLIO_STATS_URL)
+        response = portfolio_stats(request)
         
         assert response.status_code == status.HTTP_200_OK
         
         # All counts should be zero
         assert response.data['total_projects'] == 0
-        assert response.data['completed_projects'] == 0
         assert response.data['featured_projects'] == 0
         assert response.data['total_skills'] == 0
     
-    def test_skills_by_category_success(self, api_client, portfolio_skills):
+    def test_skills_by_category_success(self, api_client, portfolio_skills, django_assert_num_queries):
         """Test skills by category endpoint."""
-        url = reverse('portfolio:skills-by-category')
-        response = api_client.get(url)
+        url = SKILLS_BY_CATEGORY_URL
+        # All categories come from a single query
+        with django_assert_num_queries(1):
+            response = api_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
         assert isinstance(response.data, dict)
@@ -582,10 +634,50 @@ class TestPortfolioFunctionViews:
             for skill in skills:
                 assert skill['category'] == category
     
-    def test_skills_by_category_empty(self, api_client):
+    def test_skills_by_category_cached(self, api_client, portfolio_skills, django_assert_num_queries):
+        """Test that repeated requests are served from the cache until skills change."""
+        api_client.get(SKILLS_BY_CATEGORY_URL)
+        with django_assert_num_queries(0):
+            api_client.get(SKILLS_BY_CATEGORY_URL)
+        
+        Skill.objects.create(name='Redis', category='database', proficiency=2)
+        response = api_client.get(SKILLS_BY_CATEGORY_URL)
+        assert 'Redis' in [skill['name'] for skill in response.data['database']]
+    
+    def test_skills_by_category_not_modified(self, api_client, portfolio_skills, django_assert_num_queries):
+        """Test that a matching ETag is answered with 304 until skills change."""
+        response = api_client.get(SKILLS_BY_CATEGORY_URL)
+        etag = response['ETag']
+        
+        with django_assert_num_queries(0):
+            response = api_client.get(SKILLS_BY_CATEGORY_URL, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        
+        Skill.objects.create(name='Redis', category='database', proficiency=2)
+        response = api_client.get(SKILLS_BY_CATEGORY_URL, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response['ETag'] != etag
+    
+    def test_portfolio_stats_etag_follows_payload(self, api_client, portfolio_projects):
+        """Test that the ETag changes with the body after writes that fire no signal."""
+        from django.core.cache import cache
+        
+        response = api_client.get(PORTFOLIO_STATS_URL)
+        etag = response['ETag']
+        
+        # QuerySet.update() bypasses the signals; expire the cached payload
+        Project.objects.update(featured=False)
+        cache.clear()
+        
+        response = api_client.get(PORTFOLIO_STATS_URL, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['featured_projects'] == 0
+        assert response['ETag'] != etag
+    
+    def test_skills_by_category_empty(self, api_request_factory):
         """Test skills by category with no skills."""
-        url = reverse('portfolio:skills-by-category')
-        response = api_client.get(url)
+        request = api_request_factory.get(SKILLS_BY_CATEGORY_URL)
+        response = skills_by_category(request)
         
         assert response.status_code == status.HTTP_200_OK
         assert isinstance(response.data, dict)
@@ -593,7 +685,7 @@ class TestPortfolioFunctionViews:
     
     def test_recent_projects_success(self, api_client, portfolio_projects):
         """Test recent projects endpoint."""
-        url = reverse('portfolio:recent-projects')
+        url = RECENT_PROJECTS_URL
         response = api_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
@@ -606,15 +698,16 @@ class TestPortfolioFunctionViews:
             assert dates == sorted(dates, reverse=True)
 
 
-@pytest.mark.django_db
+@pytest.mark.django_db(transaction=False)
 @pytest.mark.integration
 class TestPortfolioAPIIntegration:
     """Integration tests for portfolio API endpoints."""
     
-    def test_portfolio_api_workflow(self, api_client, test_user, portfolio_skills):
+    def test_portfolio_api_workflow(self, api_client, portfolio_skills,
+                                    django_assert_max_num_queries):
         """Test complete portfolio API workflow."""
         # 1. Check initial empty state
-        projects_response = api_client.get(reverse('portfolio:project-list'))
+        projects_response = api_client.get(PROJECT_LIST_URL)
         assert projects_response.data['count'] == 0
         
         # 2. Create project (simulating admin action)
@@ -629,10 +722,14 @@ class TestPortfolioAPIIntegration:
             github_url='https://github.com/test/project',
             live_url='https://test-project.com'
         )
-        project.technologies.add(*portfolio_skills[:2])
+        ProjectTechnology = Project.technologies.through
+        ProjectTechnology.objects.bulk_create(
+            [ProjectTechnology(project_id=project.id, skill_id=skill.id) for skill in portfolio_skills[:2]],
+            ignore_conflicts=True
+        )
         
         # 3. Verify project appears in list
-        projects_response = api_client.get(reverse('portfolio:project-list'))
+        projects_response = api_client.get(PROJECT_LIST_URL)
         assert projects_response.data['count'] == 1
         assert projects_response.data['results'][0]['title'] == 'Integration Test Project'
         
@@ -645,15 +742,19 @@ class TestPortfolioAPIIntegration:
         assert len(detail_response.data['technologies']) == 2
         
         # 5. Check featured projects
-        featured_response = api_client.get(reverse('portfolio:featured-projects'))
+        featured_response = api_client.get(FEATURED_PROJECTS_URL)
         assert len(featured_response.data) == 1
         assert featured_response.data[0]['title'] == 'Integration Test Project'
         
         # 6. Check stats
-        stats_response = api_client.get(reverse('portfolio:portfolio-stats'))
+        stats_response = api_client.get(PORTFOLIO_STATS_URL)
         assert stats_response.data['total_projects'] == 1
-        assert stats_response.data['completed_projects'] == 1
         assert stats_response.data['featured_projects'] == 1
+        
+        # 7. Repeated stats requests are served from the cache
+        with django_assert_max_num_queries(0):
+            cached_response = api_client.get(PORTFOLIO_STATS_URL)
+        assert cached_response.data == stats_response.data
     
     def test_portfolio_api_error_handling(self, api_client):
         """Test error handling across portfolio API endpoints."""
@@ -670,77 +771,48 @@ class TestPortfolioAPIIntegration:
         assert response.status_code == status.HTTP_404_NOT_FOUND
         
         # Test invalid pagination
-        response = api_client.get(reverse('portfolio:project-list'), {'page': 999})
+        response = api_client.get(PROJECT_LIST_URL, {'page': 999})
         assert response.status_code == status.HTTP_404_NOT_FOUND
     
-    def test_portfolio_api_filtering_integration(self, api_client, test_user, portfolio_skills):
-        """Test complex filtering scenarios."""
-        # Create projects with different characteristics
-        web_project = Project.objects.create(
-            title='Web Project',
-            slug='web-project',
-            description='Web development project',
-            short_description='Web project',
-            category='web',
-            status='completed',
-            featured=True
-        )
-        web_project.technologies.add(portfolio_skills[0])
-        
-        mobile_project = Project.objects.create(
-            title='Mobile Project',
-            slug='mobile-project',
-            description='Mobile development project',
-            short_description='Mobile project',
-            category='mobile',
-            status='in_progress',
-            featured=False
-        )
-        mobile_project.technologies.add(portfolio_skills[1])
-        
-        # Test category filtering
-        response = api_client.get(reverse('portfolio:project-list'), {'category': 'web'})
-        assert len(response.data['results']) == 1
-        assert response.data['results'][0]['title'] == 'Web Project'
-        
-        # Test status filtering
-        response = api_client.get(reverse('portfolio:project-list'), {'status': 'completed'})
-        assert len(response.data['results']) == 1
-        assert response.data['results'][0]['title'] == 'Web Project'
-        
-        # Test featured filtering
-        response = api_client.get(reverse('portfolio:project-list'), {'featured': 'true'})
+    @pytest.mark.parametrize('params', [
+        {'featured': 'true'},
+        {'technologies__category': 'backend'},
+        {'search': 'Web'},
+    ])
+    def test_portfolio_api_filtering_integration(self, api_client, web_and_mobile_projects, params):
+        """Test that each project filter narrows the list down to the matching project."""
+        response = api_client.get(PROJECT_LIST_URL, params)
         assert len(response.data['results']) == 1
         assert response.data['results'][0]['title'] == 'Web Project'
-        
-        # Test technology filtering
-        response = api_client.get(
-            reverse('portfolio:project-list'), 
-            {'technologies': portfolio_skills[0].id}
-        )
+    
+    def test_portfolio_api_technology_filtering_integration(self, api_client, web_and_mobile_projects,
+                                                            portfolio_skills):
+        """Test finding projects by the name of an associated technology."""
+        response = api_client.get(PROJECT_LIST_URL, {'search': portfolio_skills[0].name})
         assert len(response.data['results']) == 1
         assert response.data['results'][0]['title'] == 'Web Project'
     
-    def test_portfolio_api_performance(self, api_client, full_test_data):
+    def test_portfolio_api_performance(self, api_client, portfolio_projects, portfolio_skills):
         """Test portfolio API performance with full dataset."""
-        # This test ensures the API performs well with a complete dataset
+        # This test ensures the API performs well with a complete portfolio
+        # dataset; blog and contact data from full_test_data are not needed
         
         # Test list view with all data
-        response = api_client.get(reverse('portfolio:project-list'))
+        response = api_client.get(PROJECT_LIST_URL)
         assert response.status_code == status.HTTP_200_OK
         
         # Test skills list with all data
-        response = api_client.get(reverse('portfolio:skill-list'))
+        response = api_client.get(SKILL_LIST_URL)
         assert response.status_code == status.HTTP_200_OK
         
         # Test filtering with full dataset
-        response = api_client.get(reverse('portfolio:project-list'), {'featured': 'true'})
+        response = api_client.get(PROJECT_LIST_URL, {'featured': 'true'})
         assert response.status_code == status.HTTP_200_OK
         
         # Test search with full dataset
-        response = api_client.get(reverse('portfolio:project-list'), {'search': 'test'})
+        response = api_client.get(PROJECT_LIST_URL, {'search': 'test'})
         assert response.status_code == status.HTTP_200_OK
         
         # Test stats with full dataset
-        response = api_client.get(reverse('portfolio:portfolio-stats'))
+        response = api_client.get(PORTFOLIO_STATS_URL)
         assert response.status_code == status.HTTP_200_OK
\ No newline at end of file
@@ -7,8 +7,9 @@ app_name = 'portfolio'
 urlpatterns = [
     # Project endpoints
     path('projects/', views.ProjectListView.as_view(), name='project-list'),
-    path('projects/<slug:slug>/', views.ProjectDetailView.as_view(), name='project-detail'),
+    # Must precede the slug route, which would otherwise match "featured"
     path('projects/featured/', views.FeaturedProjectsView.as_view(), name='featured-projects'),
+    path('projects/<slug:slug>/', views.ProjectDetailView.as_view(), name='project-detail'),
     
     # Skill endpoints
     path('skills/', views.SkillListView.as_view(), name='skill-list'),
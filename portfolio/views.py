@@ -9,24 +9,56 @@ This module provides REST API views for the portfolio functionality including:
 - Skills organized by category for better presentation
 """
 
+import hashlib
+import json
 import logging
 import time
+from itertools import groupby
+from operator import itemgetter
+from django.contrib.postgres.search import SearchQuery
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection
+from django.db.models import Count, Prefetch, Q
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
 from rest_framework import generics, filters
 from rest_framework.decorators import api_view
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
+from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
 from .models import Project, Skill
 from .serializers import ProjectSerializer, ProjectListSerializer, SkillSerializer
 from common.versioning import VersionCompatibilityMixin, deprecated_api
-from common.pagination import BaseFilteredViewMixin, ProjectPagination
+from common.pagination import BaseFilteredViewMixin, ProjectCursorPagination, ProjectPagination
 from common.monitoring import monitor_performance, PerformanceMonitor
+from common.cache import CacheManager
+from common.utils import generate_cache_key
 from common.validators import ValidationMixin
 
 # Initialize loggers
 logger = logging.getLogger('portfolio')
 performance_logger = logging.getLogger('performance')
 
+# Columns rendered by ProjectListSerializer; technologies are prefetched
+PROJECT_LIST_COLUMNS = (
+    'id', 'title', 'slug', 'description', 'github_url', 'live_url',
+    'image', 'featured', 'created_at',
+)
+# Skill columns needed to render technologies through Skill.__str__
+TECHNOLOGY_LIST_COLUMNS = ('id', 'name', 'category')
 
+
+@extend_schema_view(get=extend_schema(parameters=[
+    # Applied in get_search_queryset and apply_custom_filters, which the
+    # schema generator cannot see
+    OpenApiParameter('search', str, description='Match titles, descriptions and technology names.'),
+    OpenApiParameter(
+        'technologies__category', str,
+        enum=[choice for choice, _ in Skill._meta.get_field('category').choices],
+        description='Only projects using a technology from this skill category.',
+    ),
+]))
 class ProjectListView(ValidationMixin, BaseFilteredViewMixin, VersionCompatibilityMixin, generics.ListAPIView):
     """
     API view to list all portfolio projects with advanced filtering capabilities.
@@ -37,19 +69,104 @@ class ProjectListView(ValidationMixin, BaseFilteredViewMixin, VersionCompatibili
     - Ordering by creation date or title
     - Featured projects displayed first for prominence
     - Date range filtering for project creation dates
+    - Cursor pagination (newest first) when a ``cursor`` parameter is
+      given; an empty ``?cursor=`` requests the first page
     - Performance monitoring and metrics collection
     - Input validation and error handling
     
     This view is ideal for portfolio galleries, project archives, and
     filtered project displays based on specific technologies or criteria.
     """
-    queryset = Project.objects.all()
+    queryset = Project.objects.only(*PROJECT_LIST_COLUMNS).prefetch_related(
+        Prefetch('technologies', queryset=Skill.objects.only(*TECHNOLOGY_LIST_COLUMNS))
+    )
     serializer_class = ProjectListSerializer
     pagination_class = ProjectPagination
-    search_fields = ['title', 'description', 'technologies__name']
-    filterset_fields = ['featured', 'technologies__category']
+    # Search is applied once in get_search_queryset, not by SearchFilter
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
+    # technologies__category is applied in apply_custom_filters
+    filterset_fields = ['featured']
     ordering_fields = ['created_at', 'title']
-    ordering = ['-featured', '-created_at']
+    ordering = ['-featured', '-created_at', '-id']
+
+    @property
+    def paginator(self):
+        """
+        Return the paginator for this request.
+        
+        Page number pagination stays the default for existing clients;
+        requests carrying a ``cursor`` parameter are paginated by keyset.
+        """
+        if not hasattr(self, '_paginator'):
+            if ProjectCursorPagination.cursor_query_param in self.request.query_params:
+                self._paginator = ProjectCursorPagination()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
+
+    def get_search_queryset(self, queryset):
+        """
+        Filter projects by the ``search`` query parameter.
+        
+        On PostgreSQL, multi-word queries are matched against the weighted
+        full-text search vector, and titles are also matched by trigram
+        similarity to tolerate typos; each has its own GIN index. Other
+        databases fall back to case-insensitive substring matching.
+        Technology names are matched in a separate branch combined with
+        UNION, so the text branch stays a plain scan of the project table
+        that the planner can serve from its indexes, and the many-to-many
+        join never duplicates projects.
+        """
+        search_term = self.request.query_params.get('search', '').strip()
+        if not search_term:
+            return queryset
+        
+        if connection.vendor == 'postgresql':
+            text_matches = (
+                Q(search_vector=SearchQuery(search_term, search_type='websearch'))
+                | Q(title__trigram_similar=search_term)
+            )
+        else:
+            text_matches = Q(title__icontains=search_term) | Q(description__icontains=search_term)
+        
+        # Default ordering is not allowed in the branches of a UNION
+        text_ids = Project.objects.filter(text_matches).order_by().values('pk')
+        technology_ids = (
+            Project.technologies.through.objects
+            .filter(skill__name__icontains=search_term)
+            .order_by()
+            .values('project_id')
+        )
+        return queryset.filter(pk__in=text_ids.union(technology_ids))
+
+    def apply_custom_filters(self, queryset):
+        """
+        Filter projects by the ``technologies__category`` query parameter.
+        
+        The value is validated against the Skill category choices, as the
+        filterset would, so unknown categories are rejected with 400.
+        """
+        category = self.request.query_params.get('technologies__category')
+        if not category:
+            return queryset
+        
+        if category not in dict(Skill._meta.get_field('category').choices):
+            raise ValidationError({
+                'technologies__category': [
+                    f'Select a valid choice. {category} is not one of the available choices.'
+                ]
+            })
+        return queryset.filter(self.with_technologies(technologies__category=category))
+
+    @staticmethod
+    def with_technologies(**lookups):
+        """
+        Match projects having a technology that satisfies ``lookups``.
+        
+        The lookup runs in a subquery so the many-to-many join never
+        duplicates projects, and the list query needs no DISTINCT.
+        """
+        return Q(pk__in=Project.objects.filter(**lookups).values('pk'))
 
     def list(self, request, *args, **kwargs):
         """Override list method to add performance monitoring."""
@@ -94,15 +211,37 @@ class FeaturedProjectsView(ValidationMixin, generics.ListAPIView):
     - Input validation and error handling
     
     Projects are ordered by creation date (newest first) to show
-    the most recent featured work prominently.
+    the most recent featured work prominently. Serialized pages stay
+    in the cache until a project or skill changes.
     """
-    queryset = Project.objects.filter(featured=True)
+    queryset = (
+        Project.objects.filter(featured=True)
+        .only(*PROJECT_LIST_COLUMNS)
+        .prefetch_related(
+            Prefetch('technologies', queryset=Skill.objects.only(*TECHNOLOGY_LIST_COLUMNS))
+        )
+    )
     serializer_class = ProjectListSerializer
 
     def list(self, request, *args, **kwargs):
         """Override list method to add performance monitoring."""
+        # Only the paginator's parameters change the response, so other
+        # query parameters must not create extra cache entries
+        page_params = (self.paginator.page_query_param, self.paginator.page_size_query_param)
+        params = {
+            param: request.query_params[param]
+            for param in page_params
+            if param and param in request.query_params
+        }
+        cache_key = _portfolio_cache_key('featured_projects', params)
+        data = CacheManager.get(cache_key)
+        if data is not None:
+            return Response(data)
+        
         with PerformanceMonitor('featured_projects_query'):
-            return super().list(request, *args, **kwargs)
+            response = super().list(request, *args, **kwargs)
+        CacheManager.set(cache_key, response.data, cache_type='featured')
+        return response
 
 
 class SkillListView(ValidationMixin, BaseFilteredViewMixin, generics.ListAPIView):
@@ -123,6 +262,7 @@ class SkillListView(ValidationMixin, BaseFilteredViewMixin, generics.ListAPIView
     queryset = Skill.objects.all()
     serializer_class = SkillSerializer
     filterset_fields = ['category', 'proficiency']
+    ordering_fields = ['name', 'proficiency', 'created_at']
     ordering = ['category', 'name']
 
     def list(self, request, *args, **kwargs):
@@ -131,6 +271,50 @@ class SkillListView(ValidationMixin, BaseFilteredViewMixin, generics.ListAPIView
             return super().list(request, *args, **kwargs)
 
 
+def _portfolio_cache_key(name, params=None):
+    """
+    Build a cache key for derived portfolio data.
+    
+    The key embeds the project cache version, which the portfolio signal
+    handlers bump whenever a project or skill changes. The short cache
+    timeout bounds staleness after writes the signals cannot reach, such
+    as QuerySet.update() or a worker without a shared cache backend.
+    The optional params dict, such as pagination query parameters, is
+    folded into the key.
+    """
+    return generate_cache_key(name, CacheManager.get_version(Project._meta.label_lower), **(params or {}))
+
+
+def _portfolio_payload(data):
+    """
+    Wrap derived portfolio data for the cache together with its ETag.
+    
+    The ETag is a hash of the serialized data, so it changes whenever the
+    response body does, including after writes the signals cannot see
+    once the cached payload has expired.
+    """
+    content = json.dumps(data, sort_keys=True, cls=DjangoJSONEncoder)
+    return {
+        'data': data,
+        'etag': quote_etag(hashlib.md5(content.encode()).hexdigest()),
+    }
+
+
+def _portfolio_response(request, payload):
+    """
+    Answer a request from a cached portfolio payload.
+    
+    A matching If-None-Match is answered with 304 Not Modified, so
+    conditional requests cost no database query while the payload is
+    cached.
+    """
+    response = get_conditional_response(request, etag=payload['etag'])
+    if response is None:
+        response = Response(payload['data'])
+    response['ETag'] = payload['etag']
+    return response
+
+
 @api_view(['GET'])
 @monitor_performance('portfolio.skills_by_category')
 def skills_by_category(request):
@@ -149,26 +333,31 @@ def skills_by_category(request):
         ...
     }
     
-    Each skill includes: id, name, proficiency, description, and icon.
+    Each skill is serialized with SkillSerializer. All skills are fetched
+    in a single query ordered by category and streamed through the
+    serializer in chunks, so model instances are never all held at once,
+    before being grouped. The grouped skills are cached for 15 minutes
+    and invalidated whenever a project or skill changes.
     """
+    cache_key = _portfolio_cache_key('skills_by_category')
+    payload = CacheManager.get(cache_key)
+    if payload is not None:
+        return _portfolio_response(request, payload)
+    
     with PerformanceMonitor('skills_by_category_query'):
-        skills = Skill.objects.all().order_by('category', 'name')
-        skills_by_category = {}
+        skills = Skill.objects.order_by('category', 'name')
+        # Rows arrive sorted by category, so consecutive runs form the groups
+        skills_by_category = {
+            category: list(group)
+            for category, group in groupby(
+                SkillSerializer(skills.iterator(chunk_size=500), many=True).data,
+                key=itemgetter('category'),
+            )
+        }
+        payload = _portfolio_payload(skills_by_category)
+        CacheManager.set(cache_key, payload, cache_type='stats')
         
-        for skill in skills:
-            category = skill.category
-            if category not in skills_by_category:
-                skills_by_category[category] = []
-            
-            skills_by_category[category].append({
-                'id': skill.id,
-                'name': skill.name,
-                'proficiency': skill.proficiency,
-                'description': skill.description,
-                'icon': skill.icon.url if skill.icon else None,
-            })
-        
-        return Response(skills_by_category)
+        return _portfolio_response(request, payload)
 
 
 @api_view(['GET'])
@@ -178,7 +367,7 @@ def portfolio_stats(request):
     API endpoint to retrieve comprehensive portfolio statistics.
     
     Provides key metrics and analytics about the portfolio including:
-    - Total number of projects and their status breakdown
+    - Total number of projects
     - Featured projects count for homepage highlights
     - Skills count and category distribution
     - Years of experience calculation
@@ -186,26 +375,38 @@ def portfolio_stats(request):
     
     This endpoint is ideal for dashboard displays, portfolio summaries,
     and analytics sections that showcase portfolio scope and expertise.
+    Statistics are cached for 15 minutes and invalidated whenever a
+    project or skill changes.
     
     Returns:
         Response: JSON object containing portfolio statistics and metrics
     """
+    cache_key = _portfolio_cache_key('portfolio_stats')
+    payload = CacheManager.get(cache_key)
+    if payload is not None:
+        return _portfolio_response(request, payload)
+    
     with PerformanceMonitor('portfolio_stats_query'):
-        total_projects = Project.objects.count()
-        completed_projects = Project.objects.filter(status='completed').count()
-        featured_projects = Project.objects.filter(featured=True).count()
-        
-        total_skills = Skill.objects.count()
-        skill_categories = Skill.objects.values_list('category', flat=True).distinct().count()
+        project_counts = Project.objects.aggregate(
+            total=Count('id'),
+            featured=Count('id', filter=Q(featured=True)),
+        )
+        skill_counts = Skill.objects.aggregate(
+            total=Count('id'),
+            categories=Count('category', distinct=True),
+        )
         
         # Calculate years of experience (you might want to adjust this logic)
         years_experience = 5  # This could be calculated based on earliest project date
         
-        return Response({
-            'total_projects': total_projects,
-            'completed_projects': completed_projects,
-            'featured_projects': featured_projects,
-            'total_skills': total_skills,
-            'skill_categories': skill_categories,
+        stats = {
+            'total_projects': project_counts['total'],
+            'featured_projects': project_counts['featured'],
+            'total_skills': skill_counts['total'],
+            'skill_categories': skill_counts['categories'],
             'years_experience': years_experience
-        })
+        }
+        payload = _portfolio_payload(stats)
+        CacheManager.set(cache_key, payload, cache_type='stats')
+        
+        return _portfolio_response(request, payload)